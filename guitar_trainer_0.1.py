@@ -5,23 +5,77 @@ A modern practice tracker for guitar exercises with metronome and statistics.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+from tkinter import font as tkfont
 import os
+import re
 import sys
+import bisect
+import functools
+from dataclasses import dataclass
 from datetime import datetime
-import json
-import winsound
-import threading
 import time
-import pygame
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.dates as mdates
 import webbrowser
 try:
-    from PIL import Image, ImageTk
-except Exception:
-    Image = None
-    ImageTk = None
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    import json
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=3600)
+def _fmt_mmss(seconds):
+    """Format seconds below one hour as MM:SS (cached, the timer hits it every second)"""
+    minutes, secs = divmod(seconds, 60)
+    return f"{minutes:02d}:{secs:02d}"
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_mmss(time_str):
+    """Parse MM:SS to seconds"""
+    minutes, secs = time_str.split(':')
+    return int(minutes) * 60 + int(secs)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_hhmmss(time_str):
+    """Parse HH:MM:SS to seconds"""
+    hours, minutes, secs = time_str.split(':')
+    return int(hours) * 3600 + int(minutes) * 60 + int(secs)
+
+
+# Markdown history: "## DD Month YYYY" day headers followed by "| exercise | time | bpm |" table rows
+_DAY_RE = re.compile(r'## (.*)')
+_ROW_RE = re.compile(r'\| ([^|]*)\|([^|]*)\|([^|]*)\|')
+_MONTHS = {name: i for i, name in enumerate(
+    ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+     'August', 'September', 'October', 'November', 'December'), 1)}
+
+
+def _parse_day_header(text):
+    """Parse a 'DD Month YYYY' day header (strptime only for month names outside the table)"""
+    try:
+        day, month, year = text.split()
+        return datetime(int(year), _MONTHS[month], int(day))
+    except (ValueError, KeyError):
+        return datetime.strptime(text, '%d %B %Y')
+
+
+@dataclass
+class Workout:
+    """One practice session; slotted, since the whole history is held in memory"""
+    __slots__ = ('exercise', 'time', 'bpm', 'timestamp', 'ts', 'seconds', 'day')
+    exercise: str
+    time: str  # MM:SS or HH:MM:SS, as written to the history file
+    bpm: str
+    timestamp: str  # ISO format
+    ts: datetime  # parsed timestamp, kept so it is never re-parsed
+    seconds: int  # parsed duration, same reason
+    day: str  # ISO date (YYYY-MM-DD), the first 10 characters of timestamp; history is grouped by it
 
 
 
@@ -43,34 +97,67 @@ class ModernGuitarTrainerV2:
             # If running as compiled executable
             self.script_dir = os.path.dirname(sys.executable)
         else:
-            # If running as script - use realpath to resolve symlinks
-            self.script_dir = os.path.dirname(os.path.abspath(os.path.realpath(__file__)))
+            # If running as script
+            self.script_dir = os.path.dirname(os.path.abspath(__file__))
         
         # Initialize variables
-        self.exercises = []
+        self.exercises = []  # sorted names, see _add_exercise_name
+        self._exercise_set = set()
         self.current_exercise = None
         self.timer_running = False
         self.elapsed_time = 0
+        self._timer_start = None  # time.monotonic() value the elapsed time is measured from
+        self._timer_paused_at = None
+        self._timer_after_id = None
+        self._last_time_text = ''  # last text written to time_label, to skip identical updates
+        self._last_info_text = ''
         self.workout_data = []
+        self._data_version = 0  # bumped on every workout_data change, see _aggregate_days
+        self._days_cache = None
+        self._stats_by_exercise = {}  # exercise -> aggregated stats, see _rebuild_stats_cache
+        self._total_seconds = 0  # time of all workouts, kept alongside the stats cache
+        self._stale_set = set()  # exercises to mark as not played recently, see _refresh_stale_set
         self.data_file = os.path.join(self.script_dir, "Guitar Exercises.md")
         self.metronome_running = False
         self.metronome_bpm = 120
-        self.metronome_thread = None
         self.metronome_volume = 0.5
+        self._metronome_after_id = None
+        self._metronome_next_beat = None  # time.monotonic() value of the next scheduled click
         self.metronome_was_running_before_pause = False  # Flag to track metronome state before pause
+        self.metronome_start_btn = None  # set by _build_timer_frame
         self.exercises_structure_file = os.path.join(self.script_dir, "exercises.json")
         self.exercises_structure = {}
+        self._ex_location = {}  # exercise name -> folder holding it (None for root), see _rebuild_location_index
+        self._tree_ids = {}  # exercise name -> ex_tree item id, see _populate_ex_tree
+        self._folder_ids = {}
+        self._tree_root = None
+        self._history_tree = None  # history screen widgets, built on first visit by _build_history_screen
+        self._history_loaded = set()  # ISO days whose exercise rows are already in the history tree
+        self._manage_built = False  # manage-exercises widgets exist, see manage_exercises
+        self._drag_ghost = None  # ghost window while it is shown during a drag
+        self._ghost_win = None  # ghost Toplevel, built once and withdrawn between drags
+        self._ghost_label = None
+        self._ghost_xy = None  # pointer position the ghost was last placed at
         self.settings_file = os.path.join(self.script_dir, "settings.json")
         self.stale_days = 7
+        self.use_fast_plot = True  # draw charts on a plain tk.Canvas instead of matplotlib
+        self._stats_fig = None  # chart Figure reused by every statistics window
+        self._stats_ax = None
+        self._stats_fig_busy = False  # _stats_fig is shown in an open statistics window
+        self._dirty = set()  # names of files waiting to be written by _flush
+        self._flush_after_id = None
+        self._last_structure_hash = None  # hash of the exercises.json bytes last written
         
-        # Initialize pygame for sound
-        pygame.mixer.init()
+        # pygame is imported and the click loaded on first metronome start, see _ensure_audio
+        self._click_sound = None
         
         # Load saved data
         self.load_data()
         self.load_exercise_structure()
         self.load_settings()
         self.exercises = self.flatten_exercises()
+        self._exercise_set = set(self.exercises)
+        self._rebuild_location_index()
         
         # Setup styles
         self.setup_styles()
@@ -80,18 +167,28 @@ class ModernGuitarTrainerV2:
         
         # Show main screen
         self.show_main_screen()
+        master.protocol("WM_DELETE_WINDOW", self._on_close)
 
     def setup_styles(self):
         """Setup styles for modern appearance"""
+        # Named fonts are created once and shared by every widget
+        def font(size, weight='normal', **kwargs):
+            return tkfont.Font(family='Helvetica', size=size, weight=weight, **kwargs)
+        self.fonts = {
+            'timer': font(48, 'bold'), 'title': font(24, 'bold'), 'h1': font(20, 'bold'), 'h2': font(18, 'bold'),
+            'h3': font(16, 'bold'), 'h4': font(14, 'bold'), 'subtitle': font(14), 'button': font(12, 'bold'),
+            'body': font(12), 'small_bold': font(10, 'bold'), 'small': font(10), 'tiny_bold': font(9, 'bold'),
+            'tiny': font(9), 'link': font(9, underline=True), 'micro': font(8),
+        }
         style = ttk.Style()
         style.theme_use('clam')
-        style.configure('Title.TLabel', font=('Helvetica', 24, 'bold'), foreground='#ecf0f1', background='#2c3e50')
-        style.configure('Subtitle.TLabel', font=('Helvetica', 14), foreground='#bdc3c7', background='#2c3e50')
+        style.configure('Title.TLabel', font=self.fonts['title'], foreground='#ecf0f1', background='#2c3e50')
+        style.configure('Subtitle.TLabel', font=self.fonts['subtitle'], foreground='#bdc3c7', background='#2c3e50')
 
     # Helper functions for UI creation
     def _create_button(self, parent, text, bg, command, **kwargs):
         """Create a styled button"""
-        defaults = {'font': ('Helvetica', 14, 'bold'), 'fg': 'white', 'relief': 'flat', 'padx': 30, 'pady': 15}
+        defaults = {'font': self.fonts['h4'], 'fg': 'white', 'relief': 'flat', 'padx': 30, 'pady': 15}
         defaults.update(kwargs)
         btn = tk.Button(parent, text=text, bg=bg, command=command, **defaults)
         btn.pack(pady=kwargs.get('pady', 10))
@@ -99,47 +196,51 @@ class ModernGuitarTrainerV2:
 
     def _create_label(self, parent, text, **kwargs):
         """Create a styled label"""
-        defaults = {'font': ('Helvetica', 10), 'bg': '#2c3e50', 'fg': '#ecf0f1'}
+        defaults = {'font': self.fonts['small'], 'bg': '#2c3e50', 'fg': '#ecf0f1'}
         defaults.update(kwargs)
         return tk.Label(parent, text=text, **defaults)
 
     def _format_time(self, seconds):
         """Format seconds to MM:SS or HH:MM:SS"""
-        hours = seconds // 3600
-        minutes = (seconds % 3600) // 60
-        secs = seconds % 60
-        return f"{hours:02d}:{minutes:02d}:{secs:02d}" if hours > 0 else f"{minutes:02d}:{secs:02d}"
+        hours, rem = divmod(seconds, 3600)
+        if hours > 0:
+            minutes, secs = divmod(rem, 60)
+            return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+        return _fmt_mmss(rem)
 
     def _parse_time(self, time_str):
-        """Parse MM:SS or HH:MM:SS to seconds"""
-        parts = time_str.split(':')
-        if len(parts) == 2:
-            return int(parts[0]) * 60 + int(parts[1])
-        elif len(parts) == 3:
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-        return 0
+        """Parse MM:SS or HH:MM:SS to seconds (0 if malformed)"""
+        try:
+            return _parse_hhmmss(time_str) if time_str.count(':') == 2 else _parse_mmss(time_str)
+        except ValueError:
+            return 0
 
     def _stop_metronome(self):
         """Stop metronome and update button"""
         self.metronome_running = False
-        if hasattr(self, 'metronome_start_btn'):
+        if self._metronome_after_id is not None:
+            self.master.after_cancel(self._metronome_after_id)
+            self._metronome_after_id = None
+        self._set_metronome_button(False)
+
+    def _set_metronome_button(self, running):
+        """Show metronome state on the Start/Stop button"""
+        if self.metronome_start_btn is not None:
             try:
-                # Check if widget still exists
-                self.metronome_start_btn.winfo_exists()
-                self.metronome_start_btn.config(text="▶️ Start", bg='#27ae60')
-            except (tk.TclError, AttributeError):
-                # Widget was destroyed, ignore
-                pass
+                if running:
+                    self.metronome_start_btn.config(text="⏸️ Stop", bg='#e74c3c')
+                else:
+                    self.metronome_start_btn.config(text="▶️ Start", bg='#27ae60')
+            except tk.TclError:
+                # Widget was destroyed, forget it
+                self.metronome_start_btn = None
 
     def _create_exercise_data(self, bpm):
-        """Create exercise data dict from current state"""
-        time_str = self._format_time(self.elapsed_time - 1)
-        return {
-            'exercise': self.current_exercise,
-            'time': time_str,
-            'bpm': bpm,
-            'timestamp': datetime.now().isoformat()
-        }
+        """Create workout record from current state"""
+        time_str = self._format_time(self.elapsed_time)
+        now = datetime.now()
+        timestamp = now.isoformat()
+        return Workout(self.current_exercise, time_str, bpm, timestamp, now, self._parse_time(time_str), timestamp[:10])
 
     def _save_workout_data(self, bpm):
         """Save workout data and stop metronome"""
@@ -147,42 +248,58 @@ class ModernGuitarTrainerV2:
         if not bpm.isdigit():
             messagebox.showerror("Error", "BPM must be a number!")
             return False
-        self.workout_data.append(self._create_exercise_data(bpm))
+        data = self._create_exercise_data(bpm)
+        self.workout_data.append(data)
+        self._data_version += 1
+        self._add_to_stats_cache(data)
         self.save_data()
         self.update_total_time_display()
         return True
 
     def _group_data_by_days(self):
-        """Group workout data by days"""
-        days_data = {}
+        """Group workout data by days, keyed by the ISO date prefix (YYYY-MM-DD) of the timestamp"""
+        return self._aggregate_days()[0]
+
+    def _aggregate_days(self):
+        """Return (days_data, day_seconds, days): records per day, each day's total time and the days
+        most recent first. Computed in one pass and cached until workout_data changes (_data_version);
+        callers must not modify the result."""
+        if self._days_cache is not None and self._days_cache[0] == self._data_version:
+            return self._days_cache[1]
+        days_data, day_seconds = {}, {}
         for data in self.workout_data:
-            try:
-                date = datetime.fromisoformat(data['timestamp']).strftime('%d %B %Y')
-                days_data.setdefault(date, []).append(data)
-            except Exception:
-                continue
-        return days_data
+            day = data.day
+            days_data.setdefault(day, []).append(data)
+            day_seconds[day] = day_seconds.get(day, 0) + data.seconds
+        result = (days_data, day_seconds, self._sort_dates(days_data.keys()))
+        self._days_cache = (self._data_version, result)
+        return result
     
     def _sort_dates(self, date_strings):
-        """Sort date strings by actual date (most recent first)"""
-        def date_key(date_str):
-            try:
-                return datetime.strptime(date_str, '%d %B %Y')
-            except:
-                return datetime.min
-        return sorted(date_strings, key=date_key, reverse=True)
+        """Sort ISO date strings (most recent first) - they sort correctly as plain text"""
+        return sorted(date_strings, reverse=True)
 
-    def _cleanup_drag(self):
-        """Cleanup drag operation"""
-        if hasattr(self, '_drag_ghost') and self._drag_ghost:
+    def _format_day(self, day):
+        """Format ISO date string (YYYY-MM-DD) as DD Month YYYY for display"""
+        return datetime.fromisoformat(day).strftime('%d %B %Y')
+
+    def _hide_drag_ghost(self):
+        """Withdraw the drag ghost; the window is kept for the next drag"""
+        if self._drag_ghost is not None:
             try:
-                self._drag_ghost.destroy()
+                self._drag_ghost.withdraw()
             except Exception:
                 pass
             self._drag_ghost = None
+        self._ghost_xy = None
+
+    def _cleanup_drag(self):
+        """Cleanup drag operation"""
+        self._hide_drag_ghost()
         self._drag_item_id = None
         self._drag_start_time = None
         self._drag_start_xy = None
+        self._last_motion_xy = None
         try:
             if hasattr(self, 'ex_tree'):
                 self.ex_tree.configure(cursor='')
@@ -198,14 +315,14 @@ class ModernGuitarTrainerV2:
         # Developer info in bottom left corner
         self.developer_label = tk.Label(self.master, 
                                        text="Made by Leesty", 
-                                       font=('Helvetica', 10),
+                                       font=self.fonts['small'],
                                        bg='#2c3e50', fg='#7f8c8d')
         self.developer_label.place(relx=0.02, rely=0.95, anchor='sw')
         
         # Total workout time in bottom right corner
         self.total_time_label = tk.Label(self.master, 
                                         text="", 
-                                        font=('Helvetica', 10, 'bold'),
+                                        font=self.fonts['small_bold'],
                                         bg='#2c3e50', fg='#27ae60')
         self.total_time_label.place(relx=0.98, rely=0.95, anchor='se')
         
@@ -223,7 +340,7 @@ class ModernGuitarTrainerV2:
             ("📊 Workout History", '#27ae60', self.view_history),
             ("📝 Manage Exercises", '#f39c12', self.manage_exercises),
             ("⚙️ Settings", '#8e44ad', self.open_settings),
-            ("🚪 Exit", '#e74c3c', self.master.quit)
+            ("🚪 Exit", '#e74c3c', self._on_close)
         ]
         for text, bg, cmd in buttons:
             self._create_button(self.button_frame, text, bg, cmd)
@@ -241,6 +358,12 @@ class ModernGuitarTrainerV2:
         self.exercises_manage_frame = tk.Frame(self.main_container, bg='#34495e')
         self.exercises_manage_frame.configure(relief='raised', bd=2)
 
+        # Timer and data input screens are built once and swapped inside timer_frame
+        self.timer_screen = tk.Frame(self.timer_frame, bg='#34495e')
+        self.data_input_screen = tk.Frame(self.timer_frame, bg='#34495e')
+        self._build_timer_frame()
+        self._build_data_input_frame()
+
     def show_main_screen(self):
         """Show main screen"""
         self.exercise_frame.pack_forget()
@@ -256,8 +379,11 @@ class ModernGuitarTrainerV2:
         """Load exercise structure from JSON file. Initialize empty if file doesn't exist."""
         if os.path.exists(self.exercises_structure_file):
             try:
-                with open(self.exercises_structure_file, 'r', encoding='utf-8') as f:
-                    self.exercises_structure = json.load(f)
+                with open(self.exercises_structure_file, 'rb') as f:
+                    raw = f.read()
+                    self.exercises_structure = _json_loads(raw)
+                    # Saving unchanged structure later must not rewrite the file
+                    self._last_structure_hash = hash(raw)
                     # Ensure keys exist
                     if 'folders' not in self.exercises_structure:
                         self.exercises_structure['folders'] = {}
@@ -276,25 +402,77 @@ class ModernGuitarTrainerV2:
     def load_settings(self):
         try:
             if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(self.settings_file, 'rb') as f:
+                    data = _json_loads(f.read())
                     self.stale_days = int(data.get('stale_days', 7))
+                    self.use_fast_plot = bool(data.get('use_fast_plot', True))
             else:
                 self.save_settings()
         except Exception:
             self.stale_days = 7
+            self.use_fast_plot = True
 
     def save_settings(self):
+        self._mark_dirty('settings')
+
+    def _write_settings(self, sync=False):
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump({'stale_days': self.stale_days}, f, ensure_ascii=False, indent=2)
+            self._write_file_atomic(self.settings_file, _json_dumps({'stale_days': self.stale_days, 'use_fast_plot': self.use_fast_plot}), sync)
         except Exception:
             pass
 
     def save_exercise_structure(self):
-        """Save exercise structure to JSON file."""
-        with open(self.exercises_structure_file, 'w', encoding='utf-8') as f:
-            json.dump(self.exercises_structure, f, ensure_ascii=False, indent=2)
+        """Schedule saving exercise structure to JSON file."""
+        self._mark_dirty('structure')
+
+    def _write_exercise_structure(self, sync=False):
+        """Save exercise structure to JSON file, skipping the write if nothing changed since the last one."""
+        data = _json_dumps(self.exercises_structure)
+        data_hash = hash(data)
+        if data_hash == self._last_structure_hash:
+            return
+        try:
+            self._write_file_atomic(self.exercises_structure_file, data, sync)
+        except Exception as e:
+            # Silently fail - structure will still be in memory
+            print(f"Error saving exercise structure: {e}")
+            return
+        self._last_structure_hash = data_hash
+
+    # Deferred saving
+    def _mark_dirty(self, name):
+        """Mark a file as changed and (re)schedule one trailing write after the last change"""
+        self._dirty.add(name)
+        if self._flush_after_id is not None:
+            self.master.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.master.after(200, self._flush)
+
+    def _flush(self, sync=False):
+        """Write every file marked dirty since the last flush; sync=True also fsyncs them (used on close)"""
+        if self._flush_after_id is not None:
+            self.master.after_cancel(self._flush_after_id)
+            self._flush_after_id = None
+        writers = {'data': self._write_data, 'structure': self._write_exercise_structure, 'settings': self._write_settings}
+        while self._dirty:
+            writers[self._dirty.pop()](sync)
+
+    def _write_file_atomic(self, path, data, sync=False):
+        """Write bytes to a temp file and rename it over path, so a crash never leaves a half-written file"""
+        tmp = path + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+            if sync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp, path)
+
+    def _on_close(self):
+        """Write pending changes, forcing them to disk, and close the app"""
+        try:
+            self._flush(sync=True)
+        finally:
+            # A failed write must never keep the window from closing
+            self.master.destroy()
 
     def flatten_exercises(self):
         """Get all exercise names from structure"""
@@ -303,6 +481,62 @@ class ModernGuitarTrainerV2:
             names.update(items)
         return sorted(names)
 
+    def _rebuild_location_index(self):
+        """Map every exercise name to the folder that holds it (None for root)"""
+        self._ex_location = {}
+        dropped = False
+        # Older files may list a name more than once; it keeps its first folder (else root) and
+        # the other copies are dropped, so every name has exactly one location
+        lists = list(self.exercises_structure.setdefault('folders', {}).items())
+        lists.append((None, self.exercises_structure.setdefault('root', [])))
+        for folder, items in lists:
+            kept = []
+            for name in items:
+                if name in self._ex_location:
+                    dropped = True
+                else:
+                    self._ex_location[name] = folder
+                    kept.append(name)
+            # Lists stay sorted from here on, so later edits can insort instead of re-sorting on render
+            kept.sort()
+            items[:] = kept
+        if dropped:
+            self.save_exercise_structure()
+
+    def _exercise_list(self, folder):
+        """Return the root list (folder=None) or the list of a folder"""
+        if folder is None:
+            return self.exercises_structure.setdefault('root', [])
+        return self.exercises_structure.setdefault('folders', {}).setdefault(folder, [])
+
+    def _detach_exercise(self, name):
+        """Remove exercise from the folder/root list holding it, using the location index"""
+        if name in self._ex_location:
+            items = self._exercise_list(self._ex_location.pop(name))
+            i = bisect.bisect_left(items, name)
+            if i < len(items) and items[i] == name:
+                del items[i]
+
+    def _place_exercise(self, name, folder):
+        """Insert exercise into a folder (None for root) in sorted order and record its location"""
+        bisect.insort(self._exercise_list(folder), name)
+        self._ex_location[name] = folder
+
+    # self.exercises is kept sorted (bisect) and mirrored in _exercise_set for O(1) lookups,
+    # so edits never need a full flatten_exercises()
+    def _has_exercise(self, name):
+        return name in self._exercise_set
+
+    def _add_exercise_name(self, name):
+        if name not in self._exercise_set:
+            self._exercise_set.add(name)
+            bisect.insort(self.exercises, name)
+
+    def _remove_exercise_name(self, name):
+        if name in self._exercise_set:
+            self._exercise_set.discard(name)
+            del self.exercises[bisect.bisect_left(self.exercises, name)]
+
     def new_workout(self):
         """Start new workout"""
         if not self.exercises:
@@ -313,6 +547,7 @@ class ModernGuitarTrainerV2:
 
     def show_exercise_popup(self):
         """Show exercise selection popup with folders and statistics"""
+        self._refresh_stale_set()
         popup = tk.Toplevel(self.master)
         popup.title("Select Exercise")
         popup.geometry("700x700")
@@ -329,7 +564,7 @@ class ModernGuitarTrainerV2:
         popup.transient(self.master)
         popup.grab_set()
         
-        tk.Label(popup, text="🎯 Select Exercise", font=('Helvetica', 16, 'bold'), bg='#2c3e50', fg='#ecf0f1').pack(pady=12)
+        tk.Label(popup, text="🎯 Select Exercise", font=self.fonts['h3'], bg='#2c3e50', fg='#ecf0f1').pack(pady=12)
 
         # Left side: folder/exercise tree
         body = tk.Frame(popup, bg='#2c3e50')
@@ -341,23 +576,26 @@ class ModernGuitarTrainerV2:
         right.pack(side='right', fill='y')
 
         tree = ttk.Treeview(left, show='tree')
-        tree.pack(side='left', fill='both', expand=True)
         scr = ttk.Scrollbar(left, orient='vertical', command=tree.yview)
-        scr.pack(side='right', fill='y')
         tree.configure(yscrollcommand=scr.set)
-
-        root_node = tree.insert('', 'end', text='All Exercises', open=True)
-        for folder_name, items in sorted(self.exercises_structure.get('folders', {}).items()):
-            fnode = tree.insert(root_node, 'end', text=f"📁 {folder_name}", open=False)
-            for ex_name in sorted(items):
-                tree.insert(fnode, 'end', text=self.decorate_stale_label(ex_name))
-        for ex_name in sorted(self.exercises_structure.get('root', [])):
-            tree.insert(root_node, 'end', text=self.decorate_stale_label(ex_name))
+        tree.tag_configure('stale', foreground='#e74c3c')
+
+        # Fill the tree before it is packed so Tk lays it out once; iids map straight back to exercise names
+        ex_names = {}
+        root_node = tree.insert('', 'end', iid='root', text='All Exercises', open=True)
+        for f_idx, (folder_name, items) in enumerate(sorted(self.exercises_structure.get('folders', {}).items())):
+            fnode = tree.insert(root_node, 'end', iid=f"f{f_idx}", text=f"📁 {folder_name}", open=False)
+            for ex_name in items:
+                ex_names[tree.insert(fnode, 'end', iid=f"e{len(ex_names)}", text=ex_name, tags=self.stale_tags(ex_name))] = ex_name
+        for ex_name in self.exercises_structure.get('root', []):
+            ex_names[tree.insert(root_node, 'end', iid=f"e{len(ex_names)}", text=ex_name, tags=self.stale_tags(ex_name))] = ex_name
+        tree.pack(side='left', fill='both', expand=True)
+        scr.pack(side='right', fill='y')
 
         # Right panel: brief statistics
-        stats_title = tk.Label(right, text="Statistics", font=('Helvetica', 12, 'bold'), bg='#2c3e50', fg='#ecf0f1')
+        stats_title = tk.Label(right, text="Statistics", font=self.fonts['button'], bg='#2c3e50', fg='#ecf0f1')
         stats_title.pack(pady=(0, 6))
-        stats_text = tk.Label(right, text="—", font=('Helvetica', 10), bg='#2c3e50', fg='#ecf0f1', justify='left')
+        stats_text = tk.Label(right, text="—", font=self.fonts['small'], bg='#2c3e50', fg='#ecf0f1', justify='left')
         stats_text.pack()
 
         selected_exercise = {'name': None}
@@ -379,22 +617,10 @@ class ModernGuitarTrainerV2:
             sel = tree.selection()
             if not sel:
                 return
-            node = sel[0]
-            text = tree.item(node, 'text')
-            # Folder nodes start with "📁 "; exercises do not
-            if text.startswith('📁 '):
-                selected_exercise['name'] = None
-                update_stats_for(None)
-            elif text == 'All Exercises':
-                selected_exercise['name'] = None
-                update_stats_for(None)
-            else:
-                # Remove "🔴" label if present
-                clean_text = text.replace('🔴', '').strip()
-                # Also remove extra spaces
-                clean_text = ' '.join(clean_text.split())
-                selected_exercise['name'] = clean_text
-                update_stats_for(clean_text)
+            # Folder and root nodes have no entry in ex_names
+            name = ex_names.get(sel[0])
+            selected_exercise['name'] = name
+            update_stats_for(name)
 
         tree.bind('<<TreeviewSelect>>', on_select)
         
@@ -415,8 +641,8 @@ class ModernGuitarTrainerV2:
             popup.destroy()
             self.show_main_screen()
         
-        tk.Button(button_frame, text="🎯 Start Exercise", font=('Helvetica', 12, 'bold'), bg='#3498db', fg='white', relief='flat', padx=20, pady=10, command=start_selected_exercise).pack(side='left', padx=10, expand=True)
-        tk.Button(button_frame, text="🔙 Cancel", font=('Helvetica', 12, 'bold'), bg='#95a5a6', fg='white', relief='flat', padx=20, pady=10, command=cancel_popup).pack(side='right', padx=10, expand=True)
+        tk.Button(button_frame, text="🎯 Start Exercise", font=self.fonts['button'], bg='#3498db', fg='white', relief='flat', padx=20, pady=10, command=start_selected_exercise).pack(side='left', padx=10, expand=True)
+        tk.Button(button_frame, text="🔙 Cancel", font=self.fonts['button'], bg='#95a5a6', fg='white', relief='flat', padx=20, pady=10, command=cancel_popup).pack(side='right', padx=10, expand=True)
 
 
     def start_timer(self):
@@ -437,53 +663,73 @@ class ModernGuitarTrainerV2:
         self.exercises_manage_frame.pack_forget()
         self.timer_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Clear frame
-        for widget in self.timer_frame.winfo_children():
-            widget.destroy()
+        self._enter_timer_screen()
         
+        # Start timer
+        self.timer_running = True
+        self.elapsed_time = 0
+        self._timer_start = time.monotonic()
+        self._timer_paused_at = None
+        self.update_timer()
+
+    def _enter_timer_screen(self):
+        """Show the prebuilt timer screen and refresh its labels for the current exercise"""
+        self.data_input_screen.pack_forget()
+        self.timer_screen.pack(fill='both', expand=True)
+        self.exercise_title_label.config(text=f"🎸 {self.current_exercise}")
+        self._set_time_text("00:00")
+        try:
+            best_bpm = self.get_best_bpm(self.current_exercise)
+            last_played = self.get_last_played_date(self.current_exercise) or "—"
+            total_time = self.get_exercise_stats(self.current_exercise)['total_time_formatted']
+            info_text = f"🏆 Best BPM: {best_bpm}   |   🗓️ Last Played: {last_played}   |   ⏱️ Total Time: {total_time}"
+        except Exception:
+            info_text = "🏆 Best BPM: 0   |   🗓️ Last Played: —   |   ⏱️ Total Time: 00:00"
+        if info_text != self._last_info_text:
+            self.exercise_info_label.config(text=info_text)
+            self._last_info_text = info_text
+        self.bpm_label.config(text=f"BPM: {self.metronome_bpm}")
+        self.pause_btn.config(text="⏸️ Pause")
+        if not self.metronome_running:
+            self._set_metronome_button(False)
+
+    def _build_timer_frame(self):
+        """Create timer screen widgets once; _enter_timer_screen only refreshes them"""
         # Exercise information
-        tk.Label(self.timer_frame, 
-                text=f"🎸 {self.current_exercise}", 
-                font=('Helvetica', 20, 'bold'),
-                bg='#34495e', fg='#ecf0f1').pack(pady=20)
+        self.exercise_title_label = tk.Label(self.timer_screen, 
+                text="", 
+                font=self.fonts['h1'],
+                bg='#34495e', fg='#ecf0f1')
+        self.exercise_title_label.pack(pady=20)
         
         # Timer
-        self.time_label = tk.Label(self.timer_frame, 
+        self.time_label = tk.Label(self.timer_screen, 
                                   text="00:00", 
-                                  font=('Helvetica', 48, 'bold'),
+                                  font=self.fonts['timer'],
                                   bg='#34495e', fg='#3498db')
         self.time_label.pack(pady=20)
         
         # Exercise info: best BPM, last played date, total time
-        info_frame = tk.Frame(self.timer_frame, bg='#34495e')
+        info_frame = tk.Frame(self.timer_screen, bg='#34495e')
         info_frame.pack(pady=(0, 10))
-        try:
-            best_bpm = self.get_best_bpm(self.current_exercise)
-            last_played = self.get_last_played_date(self.current_exercise) or "—"
-            total_time = self.get_exercise_stats(self.current_exercise)['total_time_formatted']
-            self.exercise_info_label = tk.Label(info_frame,
-                                                text=f"🏆 Best BPM: {best_bpm}   |   🗓️ Last Played: {last_played}   |   ⏱️ Total Time: {total_time}",
-                                                font=('Helvetica', 10, 'bold'),
-                                                bg='#34495e', fg='#bdc3c7')
-        except Exception as e:
-            self.exercise_info_label = tk.Label(info_frame,
-                                                text=f"🏆 Best BPM: 0   |   🗓️ Last Played: —   |   ⏱️ Total Time: 00:00",
-                                                font=('Helvetica', 10, 'bold'),
-                                                bg='#34495e', fg='#bdc3c7')
+        self.exercise_info_label = tk.Label(info_frame,
+                                            text="",
+                                            font=self.fonts['small_bold'],
+                                            bg='#34495e', fg='#bdc3c7')
         self.exercise_info_label.pack()
 
         # INFO button for current exercise (compact, in top right corner of timer)
-        info_btn = tk.Button(self.timer_frame, text='ℹ️', font=('Helvetica', 9, 'bold'), bg='#2980b9', fg='white', relief='flat', padx=6, pady=2, command=self.show_current_exercise_info)
+        info_btn = tk.Button(self.timer_screen, text='ℹ️', font=self.fonts['tiny_bold'], bg='#2980b9', fg='white', relief='flat', padx=6, pady=2, command=self.show_current_exercise_info)
         info_btn.place(relx=0.98, rely=0.02, anchor='ne')
         
         # Metronome section
-        metronome_frame = tk.Frame(self.timer_frame, bg='#34495e')
+        metronome_frame = tk.Frame(self.timer_screen, bg='#34495e')
         metronome_frame.pack(pady=20)
         
         # Metronome title
         tk.Label(metronome_frame, 
                 text="🎵 Metronome", 
-                font=('Helvetica', 14, 'bold'),
+                font=self.fonts['h4'],
                 bg='#34495e', fg='#ecf0f1').pack()
         
         # BPM display and control
@@ -492,7 +738,7 @@ class ModernGuitarTrainerV2:
         
         self.bpm_label = tk.Label(bpm_frame, 
                                  text=f"BPM: {self.metronome_bpm}", 
-                                 font=('Helvetica', 16, 'bold'),
+                                 font=self.fonts['h3'],
                                  bg='#34495e', fg='#3498db')
         self.bpm_label.pack()
         
@@ -500,18 +746,18 @@ class ModernGuitarTrainerV2:
         bpm_buttons_frame = tk.Frame(metronome_frame, bg='#34495e')
         bpm_buttons_frame.pack(pady=10)
         for text, delta in [("-5", -5), ("-1", -1)]:
-            tk.Button(bpm_buttons_frame, text=text, font=('Helvetica', 10, 'bold'), bg='#e74c3c', fg='white',
+            tk.Button(bpm_buttons_frame, text=text, font=self.fonts['small_bold'], bg='#e74c3c', fg='white',
                      relief='flat', padx=10, pady=5, command=lambda d=delta: self.change_bpm(d)).pack(side='left', padx=2)
-        self.metronome_start_btn = tk.Button(bpm_buttons_frame, text="▶️ Start", font=('Helvetica', 10, 'bold'),
+        self.metronome_start_btn = tk.Button(bpm_buttons_frame, text="▶️ Start", font=self.fonts['small_bold'],
                                             bg='#27ae60', fg='white', relief='flat', padx=15, pady=5,
                                             command=self.toggle_metronome)
         self.metronome_start_btn.pack(side='left', padx=5)
         for text, delta in [("+1", 1), ("+5", 5)]:
-            tk.Button(bpm_buttons_frame, text=text, font=('Helvetica', 10, 'bold'), bg='#e74c3c', fg='white',
+            tk.Button(bpm_buttons_frame, text=text, font=self.fonts['small_bold'], bg='#e74c3c', fg='white',
                      relief='flat', padx=10, pady=5, command=lambda d=delta: self.change_bpm(d)).pack(side='left', padx=2)
 
         # Volume button (dropdown control)
-        volume_button = tk.Menubutton(bpm_buttons_frame, text="🔊", font=('Helvetica', 10, 'bold'), bg='#34495e', fg='#ecf0f1', relief='flat')
+        volume_button = tk.Menubutton(bpm_buttons_frame, text="🔊", font=self.fonts['small_bold'], bg='#34495e', fg='#ecf0f1', relief='flat')
         volume_menu = tk.Menu(volume_button, tearoff=0, bg='#2c3e50', fg='#ecf0f1')
         volume_button.config(menu=volume_menu)
         volume_menu.add_command(label="Quieter", command=lambda: self.change_volume(-0.1))
@@ -523,89 +769,102 @@ class ModernGuitarTrainerV2:
         volume_button.pack(side='left', padx=6)
         
         # Exercise control buttons
-        control_frame = tk.Frame(self.timer_frame, bg='#34495e')
+        control_frame = tk.Frame(self.timer_screen, bg='#34495e')
         control_frame.pack(pady=20)
         buttons = [("⏸️ Pause", '#f39c12', self.pause_timer, True), ("✅ Finish", '#27ae60', self.finish_exercise, False),
                   ("🔙 Cancel", '#e74c3c', self.cancel_exercise, False)]
         for text, bg, cmd, is_pause in buttons:
-            btn = tk.Button(control_frame, text=text, font=('Helvetica', 12, 'bold'), bg=bg, fg='white',
+            btn = tk.Button(control_frame, text=text, font=self.fonts['button'], bg=bg, fg='white',
                            relief='flat', padx=20, pady=10, command=cmd)
             btn.pack(side='left', padx=10)
             if is_pause:
                 self.pause_btn = btn
-        
-        # Start timer
-        self.timer_running = True
-        self.elapsed_time = 0
-        self.update_timer()
 
     def update_timer(self):
-        """Update timer"""
+        """Update timer from the monotonic clock and schedule the next tick on the second boundary"""
+        self._timer_after_id = None
+        if self.timer_running:
+            elapsed = time.monotonic() - self._timer_start
+            self.elapsed_time = int(elapsed)
+            self._set_time_text(self._format_time(self.elapsed_time))
+            delay = max(1, 1000 - int(elapsed * 1000) % 1000)
+            self._timer_after_id = self.master.after(delay, self.update_timer)
+
+    def _set_time_text(self, text):
+        """Update timer label only when the displayed text actually changes"""
+        if text != self._last_time_text:
+            self.time_label.config(text=text)
+            self._last_time_text = text
+
+    def _stop_timer(self):
+        """Stop timer, freeze elapsed time and cancel the pending tick"""
         if self.timer_running:
-            self.time_label.config(text=self._format_time(self.elapsed_time))
-            self.elapsed_time += 1
-            self.master.after(1000, self.update_timer)
+            self.elapsed_time = int(time.monotonic() - self._timer_start)
+            self._timer_paused_at = time.monotonic()
+        self.timer_running = False
+        if self._timer_after_id is not None:
+            self.master.after_cancel(self._timer_after_id)
+            self._timer_after_id = None
 
     def pause_timer(self):
         """Pause/resume timer"""
         if self.timer_running:
             # Pause
-            self.timer_running = False
+            self._stop_timer()
             self.pause_btn.config(text="▶️ Resume")
             # Remember metronome state and stop it
             self.metronome_was_running_before_pause = self.metronome_running
             if self.metronome_running:
                 self._stop_metronome()
         else:
-            # Resume
+            # Resume - shift start by the paused duration so elapsed time continues from where it stopped
+            self._timer_start += time.monotonic() - self._timer_paused_at
             self.timer_running = True
             self.pause_btn.config(text="⏸️ Pause")
             self.update_timer()
             # Resume metronome if it was running before pause
             if self.metronome_was_running_before_pause and not self.metronome_running:
-                self.metronome_running = True
-                if hasattr(self, 'metronome_start_btn'):
-                    try:
-                        self.metronome_start_btn.winfo_exists()
-                        self.metronome_start_btn.config(text="⏸️ Stop", bg='#e74c3c')
-                    except (tk.TclError, AttributeError):
-                        pass
-                self.metronome_thread = threading.Thread(target=self.metronome_loop, daemon=True)
-                self.metronome_thread.start()
+                self._play_metronome()
                 self.metronome_was_running_before_pause = False
 
     def finish_exercise(self):
         """Finish exercise"""
-        self.timer_running = False
+        self._stop_timer()
         self.show_exercise_data_input()
 
     def cancel_exercise(self):
         """Cancel exercise"""
-        self.timer_running = False
+        self._stop_timer()
         self._stop_metronome()
         self.show_main_screen()
 
     def show_exercise_data_input(self):
         """Show exercise data input"""
-        for widget in self.timer_frame.winfo_children():
-            widget.destroy()
-        tk.Label(self.timer_frame, text="📊 Exercise Data", font=('Helvetica', 18, 'bold'),
-                bg='#34495e', fg='#ecf0f1').pack(pady=20)
-        tk.Label(self.timer_frame, text=f"Execution Time: {self._format_time(self.elapsed_time - 1)}",
-                font=('Helvetica', 14), bg='#34495e', fg='#bdc3c7').pack(pady=10)
-        input_frame = tk.Frame(self.timer_frame, bg='#34495e')
-        input_frame.pack(pady=20)
-        tk.Label(input_frame, text="Best BPM:", font=('Helvetica', 12), bg='#34495e', fg='#ecf0f1').pack(anchor='w')
-        self.bpm_entry = tk.Entry(input_frame, font=('Helvetica', 12), width=20)
+        self.timer_screen.pack_forget()
+        self.data_input_screen.pack(fill='both', expand=True)
+        self.execution_time_label.config(text=f"Execution Time: {self._format_time(self.elapsed_time)}")
         best_bpm = self.get_best_bpm(self.current_exercise) if self.current_exercise else 0
         default_bpm = best_bpm if best_bpm > 0 else self.metronome_bpm
+        self.bpm_entry.delete(0, 'end')
         self.bpm_entry.insert(0, str(default_bpm))
+
+    def _build_data_input_frame(self):
+        """Create exercise data input widgets once; show_exercise_data_input only refreshes them"""
+        tk.Label(self.data_input_screen, text="📊 Exercise Data", font=self.fonts['h2'],
+                bg='#34495e', fg='#ecf0f1').pack(pady=20)
+        self.execution_time_label = tk.Label(self.data_input_screen, text="",
+                font=self.fonts['subtitle'], bg='#34495e', fg='#bdc3c7')
+        self.execution_time_label.pack(pady=10)
+        input_frame = tk.Frame(self.data_input_screen, bg='#34495e')
+        input_frame.pack(pady=20)
+        tk.Label(input_frame, text="Best BPM:", font=self.fonts['body'], bg='#34495e', fg='#ecf0f1').pack(anchor='w')
+        self.bpm_entry = tk.Entry(input_frame, font=self.fonts['body'], width=20)
         self.bpm_entry.pack(pady=5)
-        button_frame = tk.Frame(self.timer_frame, bg='#34495e')
+        button_frame = tk.Frame(self.data_input_screen, bg='#34495e')
         button_frame.pack(pady=30)
-        tk.Button(button_frame, text="🏁 Finish", font=('Helvetica', 12, 'bold'), bg='#27ae60', fg='white',
+        tk.Button(button_frame, text="🏁 Finish", font=self.fonts['button'], bg='#27ae60', fg='white',
                  relief='flat', padx=20, pady=10, command=self.finish_workout).pack(side='left', padx=10)
-        tk.Button(button_frame, text="🔄 Continue Workout", font=('Helvetica', 12, 'bold'), bg='#3498db', fg='white',
+        tk.Button(button_frame, text="🔄 Continue Workout", font=self.fonts['button'], bg='#3498db', fg='white',
                  relief='flat', padx=20, pady=10, command=self.save_and_continue).pack(side='left', padx=10)
 
     def save_exercise(self):
@@ -631,33 +890,47 @@ class ModernGuitarTrainerV2:
 
     def manage_exercises(self):
         """Manage Exercises"""
-        # Destroy any remaining ghost windows before recreating interface
-        if hasattr(self, '_drag_ghost') and self._drag_ghost is not None:
-            try:
-                self._drag_ghost.destroy()
-            except Exception:
-                pass
-            self._drag_ghost = None
+        # End any unfinished drag before showing the screen again
+        self._cleanup_drag()
         
         self.button_frame.pack_forget()
         self.exercises_manage_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Clear frame
-        for widget in self.exercises_manage_frame.winfo_children():
-            widget.destroy()
-        
+        # The panels are built once; later visits only refill the tree
+        if self._manage_built:
+            self._refresh_ex_tree()
+        else:
+            self._build_manage_screen()
+            self._manage_built = True
+
+    def _refresh_ex_tree(self):
+        """Refill the exercise tree and clear the INFO fields, keeping the rest of the manage screen"""
+        self.ex_tree.delete(*self.ex_tree.get_children())
+        self._populate_ex_tree()
+        self._show_info("", "")
+        self.new_folder_entry.delete(0, 'end')
+
+    def _show_info(self, link, note):
+        """Put link/note into the INFO fields, skipping the Tk variable write when a value is unchanged"""
+        if self.info_link_var.get() != link:
+            self.info_link_var.set(link)
+        if self.info_note_var.get() != note:
+            self.info_note_var.set(note)
+
+    def _build_manage_screen(self):
+        """Create the manage-exercises widgets; called once, on the first visit"""
         # Header and back button at top
         header_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
         header_frame.pack(fill='x', pady=20, padx=20)
         
         tk.Label(header_frame, 
                 text="📝 Manage Exercises", 
-                font=('Helvetica', 18, 'bold'),
+                font=self.fonts['h2'],
                 bg='#34495e', fg='#ecf0f1').pack(side='left')
         
         tk.Button(header_frame, 
                  text="🔙 Back", 
-                 font=('Helvetica', 10, 'bold'),
+                 font=self.fonts['small_bold'],
                  bg='#95a5a6', fg='white',
                  relief='flat', padx=15, pady=5,
                  command=self.show_main_screen).pack(side='right')
@@ -666,32 +939,32 @@ class ModernGuitarTrainerV2:
         add_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
         add_frame.pack(pady=10, fill='x', padx=20)
         # Folder
-        tk.Label(add_frame, text="New Folder:", font=('Helvetica', 10), bg='#34495e', fg='#ecf0f1').pack(side='left')
-        self.new_folder_entry = tk.Entry(add_frame, font=('Helvetica', 10), width=20)
+        tk.Label(add_frame, text="New Folder:", font=self.fonts['small'], bg='#34495e', fg='#ecf0f1').pack(side='left')
+        self.new_folder_entry = tk.Entry(add_frame, font=self.fonts['small'], width=20)
         self.new_folder_entry.pack(side='left', padx=6)
-        tk.Button(add_frame, text="📁 Create", font=('Helvetica', 10, 'bold'), bg='#27ae60', fg='white', relief='flat', padx=10, pady=4, command=self.create_folder).pack(side='left', padx=6)
+        tk.Button(add_frame, text="📁 Create", font=self.fonts['small_bold'], bg='#27ae60', fg='white', relief='flat', padx=10, pady=4, command=self.create_folder).pack(side='left', padx=6)
         # Exercise addition dialog
-        tk.Button(add_frame, text="🗂️ Add Exercise", font=('Helvetica', 10, 'bold'), bg='#27ae60', fg='white', relief='flat', padx=12, pady=4, command=self.open_add_exercise_dialog).pack(side='left', padx=(20, 0))
-        tk.Button(add_frame, text="🗑️ Delete Folder", font=('Helvetica', 10, 'bold'), bg='#e74c3c', fg='white', relief='flat', padx=12, pady=4, command=self.delete_folder_dialog).pack(side='left', padx=6)
+        tk.Button(add_frame, text="🗂️ Add Exercise", font=self.fonts['small_bold'], bg='#27ae60', fg='white', relief='flat', padx=12, pady=4, command=self.open_add_exercise_dialog).pack(side='left', padx=(20, 0))
+        tk.Button(add_frame, text="🗑️ Delete Folder", font=self.fonts['small_bold'], bg='#e74c3c', fg='white', relief='flat', padx=12, pady=4, command=self.delete_folder_dialog).pack(side='left', padx=6)
 
         # INFO for selected exercise
         info_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
         info_frame.pack(fill='x', padx=20, pady=(6, 6))
-        tk.Label(info_frame, text="INFO: link/note", font=('Helvetica', 10, 'bold'), bg='#34495e', fg='#ecf0f1').pack(anchor='w')
+        tk.Label(info_frame, text="INFO: link/note", font=self.fonts['small_bold'], bg='#34495e', fg='#ecf0f1').pack(anchor='w')
         info_inputs = tk.Frame(info_frame, bg='#34495e')
         info_inputs.pack(fill='x')
         # Use grid layout so Save button always fits
-        tk.Label(info_inputs, text="Link:", font=('Helvetica', 9), bg='#34495e', fg='#ecf0f1').grid(row=0, column=0, sticky='w')
+        tk.Label(info_inputs, text="Link:", font=self.fonts['tiny'], bg='#34495e', fg='#ecf0f1').grid(row=0, column=0, sticky='w')
         self.info_link_var = tk.StringVar()
-        self.info_entry = tk.Entry(info_inputs, textvariable=self.info_link_var, font=('Helvetica', 10), width=45)
+        self.info_entry = tk.Entry(info_inputs, textvariable=self.info_link_var, font=self.fonts['small'], width=45)
         self.info_entry.grid(row=0, column=1, sticky='we', padx=6, pady=2)
-        tk.Label(info_inputs, text="Note:", font=('Helvetica', 9), bg='#34495e', fg='#ecf0f1').grid(row=0, column=2, sticky='w', padx=(10,0))
+        tk.Label(info_inputs, text="Note:", font=self.fonts['tiny'], bg='#34495e', fg='#ecf0f1').grid(row=0, column=2, sticky='w', padx=(10,0))
         self.info_note_var = tk.StringVar()
-        self.info_note_entry = tk.Entry(info_inputs, textvariable=self.info_note_var, font=('Helvetica', 10), width=28)
+        self.info_note_entry = tk.Entry(info_inputs, textvariable=self.info_note_var, font=self.fonts['small'], width=28)
         self.info_note_entry.grid(row=0, column=3, sticky='we', padx=6, pady=2)
         btns = tk.Frame(info_inputs, bg='#34495e')
         btns.grid(row=1, column=0, columnspan=4, sticky='w', pady=4)
-        tk.Button(btns, text="💾 Save", font=('Helvetica', 9), bg='#2980b9', fg='white', relief='flat', padx=8, pady=3, command=self.save_selected_info).pack(side='left')
+        tk.Button(btns, text="💾 Save", font=self.fonts['tiny'], bg='#2980b9', fg='white', relief='flat', padx=8, pady=3, command=self.save_selected_info).pack(side='left')
         info_inputs.columnconfigure(1, weight=1)
         info_inputs.columnconfigure(3, weight=1)
 
@@ -699,72 +972,65 @@ class ModernGuitarTrainerV2:
         tree_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
         tree_frame.pack(fill='both', expand=True, padx=20, pady=10)
         self.ex_tree = ttk.Treeview(tree_frame, show='tree')
+        self._ex_tree_path = str(self.ex_tree)  # widget path, compared on every release in the manage frame
         self.ex_tree.pack(side='left', fill='both', expand=True)
         scrollbar = ttk.Scrollbar(tree_frame, orient='vertical', command=self.ex_tree.yview)
         scrollbar.pack(side='right', fill='y')
         self.ex_tree.configure(yscrollcommand=scrollbar.set)
 
-        root_node = self.ex_tree.insert('', 'end', text='All Exercises', open=True)
-        # Folders (closed by default)
-        for folder_name, items in sorted(self.exercises_structure.get('folders', {}).items()):
-            fnode = self.ex_tree.insert(root_node, 'end', text=f"📁 {folder_name}", open=False)
-            for ex_name in sorted(items):
-                self.ex_tree.insert(fnode, 'end', text=ex_name)
-        # Root exercises
-        for ex_name in sorted(self.exercises_structure.get('root', [])):
-            self.ex_tree.insert(root_node, 'end', text=ex_name)
+        self._populate_ex_tree()
 
         # Update INFO on selection
         def on_tree_select(event):
             sel = self.get_selected_tree_item()
             if not sel:
-                self.info_link_var.set("")
-                self.info_note_var.set("")
+                self._show_info("", "")
                 return
             _, text = sel
             if text.startswith('📁 ') or text == 'All Exercises':
-                self.info_link_var.set("")
-                self.info_note_var.set("")
+                self._show_info("", "")
                 return
             info = self.exercises_structure.get('info', {}).get(text, {})
-            self.info_link_var.set(info.get('link', ''))
-            self.info_note_var.set(info.get('note', ''))
+            self._show_info(info.get('link', ''), info.get('note', ''))
         self.ex_tree.bind('<<TreeviewSelect>>', on_tree_select)
 
         # Drag & Drop movement of exercises between folders/root (with delay/threshold)
         self._drag_item_id = None
         self._drag_start_time = None
         self._drag_start_xy = None
-        self._drag_ghost = None
+        self._motion_pending = False  # a motion update is scheduled, see _flush_motion
+        self._last_motion_xy = None
         def _create_drag_ghost(text, x, y):
             try:
-                ghost = tk.Toplevel(self.master)
-                ghost.overrideredirect(True)
-                try:
-                    ghost.attributes('-alpha', 0.85)
-                except Exception:
-                    pass
-                lbl = tk.Label(ghost, text=text, font=('Helvetica', 9, 'bold'), bg='#2c3e50', fg='#ecf0f1', padx=6, pady=2, relief='solid', bd=1)
-                lbl.pack()
+                ghost = self._ghost_win
+                if ghost is None or not ghost.winfo_exists():
+                    # Build the Toplevel on the first drag only; later drags just show it again
+                    ghost = self._ghost_win = tk.Toplevel(self.master)
+                    ghost.overrideredirect(True)
+                    try:
+                        ghost.attributes('-alpha', 0.85)
+                    except Exception:
+                        pass
+                    self._ghost_label = tk.Label(ghost, font=self.fonts['tiny_bold'], bg='#2c3e50', fg='#ecf0f1', padx=6, pady=2, relief='solid', bd=1)
+                    self._ghost_label.pack()
+                    ghost.attributes('-topmost', True)
+                self._ghost_label.config(text=text)
+                # Position before showing so a reused ghost never flashes at its old spot
+                ghost.wm_geometry("+%d+%d" % (x + 12, y + 12))
+                self._ghost_xy = (x, y)
+                ghost.deiconify()
                 ghost.lift()
-                ghost.attributes('-topmost', True)
-                ghost.geometry(f"+{x+12}+{y+12}")
                 return ghost
             except Exception:
                 return None
         def _move_drag_ghost(x, y):
-            if self._drag_ghost is not None:
-                try:
-                    self._drag_ghost.geometry(f"+{x+12}+{y+12}")
-                except Exception:
-                    pass
-        def _destroy_drag_ghost():
-            if self._drag_ghost is not None:
+            # Skip the Tk call when the pointer has not moved since the last placement
+            if self._drag_ghost is not None and (x, y) != self._ghost_xy:
+                self._ghost_xy = (x, y)
                 try:
-                    self._drag_ghost.destroy()
+                    self._drag_ghost.wm_geometry("+%d+%d" % (x + 12, y + 12))
                 except Exception:
                     pass
-                self._drag_ghost = None
         def on_drag_start(event):
             item = self.ex_tree.identify_row(event.y)
             if item:
@@ -773,7 +1039,9 @@ class ModernGuitarTrainerV2:
                 if item_text not in ('All Exercises', ) and not item_text.startswith('📁 '):
                     self._drag_item_id = item
                     self._drag_start_time = time.time()
-                    self._drag_start_xy = (event.x_root, event.y_root)
+                    self._drag_start_xy = (event.x_root or 0, event.y_root or 0)
+                    # A motion flush still pending from the previous drag must not reuse its pointer
+                    self._last_motion_xy = None
                     # Change cursor for grab feeling
                     try:
                         self.ex_tree.configure(cursor='fleur')
@@ -782,13 +1050,23 @@ class ModernGuitarTrainerV2:
         def on_drag_motion(event):
             if not self._drag_item_id:
                 return
-            dt = (time.time() - self._drag_start_time) if self._drag_start_time else 0
-            dx = abs((event.x_root or 0) - (self._drag_start_xy[0] if self._drag_start_xy else 0))
-            dy = abs((event.y_root or 0) - (self._drag_start_xy[1] if self._drag_start_xy else 0))
-            if (dt >= 0.1 or (dx + dy) >= 4) and self._drag_ghost is None:
+            # Only remember the pointer here; the ghost is updated at most once per frame
+            self._last_motion_xy = (event.x_root or 0, event.y_root or 0)
+            if not self._motion_pending:
+                self._motion_pending = True
+                self.master.after(16, _flush_motion)
+        def _flush_motion():
+            self._motion_pending = False
+            if not self._drag_item_id or self._last_motion_xy is None:
+                return
+            x, y = self._last_motion_xy
+            dx = x - self._drag_start_xy[0]
+            dy = y - self._drag_start_xy[1]
+            # Show the ghost once the pointer has moved at least 4 px from the press point
+            if self._drag_ghost is None and dx * dx + dy * dy >= 16:
                 dragged_text = self.ex_tree.item(self._drag_item_id, 'text')
-                self._drag_ghost = _create_drag_ghost(dragged_text, event.x_root, event.y_root)
-            _move_drag_ghost(event.x_root, event.y_root)
+                self._drag_ghost = _create_drag_ghost(dragged_text, x, y)
+            _move_drag_ghost(x, y)
         def on_drag_release(event):
             if not self._drag_item_id:
                 return
@@ -809,28 +1087,24 @@ class ModernGuitarTrainerV2:
                 target = self.ex_tree.parent(target)
                 target_text = self.ex_tree.item(target, 'text')
             
-            # Remove from all locations
-            root_list = self.exercises_structure.get('root', [])
-            if dragged_text in root_list:
-                root_list.remove(dragged_text)
-            for items in self.exercises_structure.get('folders', {}).values():
-                if dragged_text in items:
-                    items.remove(dragged_text)
-            
-            # Add to destination
             if target_text == 'All Exercises':
-                root_list = self.exercises_structure.setdefault('root', [])
-                if dragged_text not in root_list:
-                    root_list.append(dragged_text)
+                dest = None
             elif target_text.startswith('📁 '):
-                folder_list = self.exercises_structure.setdefault('folders', {}).setdefault(target_text[2:].strip(), [])
-                if dragged_text not in folder_list:
-                    folder_list.append(dragged_text)
+                dest = target_text[2:].strip()
+            else:
+                self._cleanup_drag()
+                return
+            # Dropped where it already is: nothing to move or save
+            if dragged_text in self._ex_location and self._ex_location[dragged_text] == dest:
+                self._cleanup_drag()
+                return
+            # Move from current location to destination
+            self._detach_exercise(dragged_text)
+            self._place_exercise(dragged_text, dest)
             try:
                 self.save_exercise_structure()
-                self.exercises = self.flatten_exercises()
                 self._cleanup_drag()
-                self.manage_exercises()
+                self._tree_place(dragged_text)
             except Exception:
                 self._cleanup_drag()
                 raise
@@ -840,7 +1114,7 @@ class ModernGuitarTrainerV2:
         
         def cleanup_on_release_outside(event):
             widget = event.widget
-            if widget != self.ex_tree and not str(widget).startswith(str(self.ex_tree)):
+            if widget is not self.ex_tree and not str(widget).startswith(self._ex_tree_path):
                 if hasattr(self, '_drag_item_id') and self._drag_item_id:
                     self._cleanup_drag()
         
@@ -850,11 +1124,11 @@ class ModernGuitarTrainerV2:
         # Movement control panel
         move_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
         move_frame.pack(fill='x', padx=20, pady=(0, 10))
-        tk.Button(move_frame, text="➡️ To Folder", font=('Helvetica', 9), bg='#f39c12', fg='white', relief='flat', padx=10, pady=4, command=self.move_selected_to_folder).pack(side='left', padx=5)
-        tk.Button(move_frame, text="🗑️ Remove from Folder", font=('Helvetica', 9), bg='#e74c3c', fg='white', relief='flat', padx=10, pady=4, command=self.remove_selected_from_folder).pack(side='left', padx=5)
-        tk.Button(move_frame, text="📈 Chart", font=('Helvetica', 9), bg='#9b59b6', fg='white', relief='flat', padx=10, pady=4, command=self.show_stats_for_selected).pack(side='left', padx=5)
-        tk.Button(move_frame, text="🗑️ Delete exercise", font=('Helvetica', 9), bg='#e74c3c', fg='white', relief='flat', padx=10, pady=4, command=self.delete_selected_exercise).pack(side='left', padx=5)
-        tk.Button(move_frame, text="✏️ Rename", font=('Helvetica', 9), bg='#8e44ad', fg='white', relief='flat', padx=10, pady=4, command=self.rename_selected_exercise).pack(side='left', padx=5)
+        tk.Button(move_frame, text="➡️ To Folder", font=self.fonts['tiny'], bg='#f39c12', fg='white', relief='flat', padx=10, pady=4, command=self.move_selected_to_folder).pack(side='left', padx=5)
+        tk.Button(move_frame, text="🗑️ Remove from Folder", font=self.fonts['tiny'], bg='#e74c3c', fg='white', relief='flat', padx=10, pady=4, command=self.remove_selected_from_folder).pack(side='left', padx=5)
+        tk.Button(move_frame, text="📈 Chart", font=self.fonts['tiny'], bg='#9b59b6', fg='white', relief='flat', padx=10, pady=4, command=self.show_stats_for_selected).pack(side='left', padx=5)
+        tk.Button(move_frame, text="🗑️ Delete exercise", font=self.fonts['tiny'], bg='#e74c3c', fg='white', relief='flat', padx=10, pady=4, command=self.delete_selected_exercise).pack(side='left', padx=5)
+        tk.Button(move_frame, text="✏️ Rename", font=self.fonts['tiny'], bg='#8e44ad', fg='white', relief='flat', padx=10, pady=4, command=self.rename_selected_exercise).pack(side='left', padx=5)
         
         # Back button - place in separate frame at bottom
         back_frame = tk.Frame(self.exercises_manage_frame, bg='#34495e')
@@ -862,24 +1136,56 @@ class ModernGuitarTrainerV2:
         
         tk.Button(back_frame, 
                  text="🔙 Back", 
-                font=('Helvetica', 12, 'bold'),
+                font=self.fonts['button'],
                  bg='#95a5a6', fg='white',
                  relief='flat', padx=20, pady=10,
                  command=self.show_main_screen).pack()
 
 
+    def _populate_ex_tree(self):
+        """Fill ex_tree from the exercise structure and remember item ids for targeted updates"""
+        self._tree_ids, self._folder_ids = {}, {}
+        self._tree_root = self.ex_tree.insert('', 'end', text='All Exercises', open=True)
+        # Folders (closed by default)
+        for folder_name, items in sorted(self.exercises_structure.get('folders', {}).items()):
+            fnode = self.ex_tree.insert(self._tree_root, 'end', text=f"📁 {folder_name}", open=False)
+            self._folder_ids[folder_name] = fnode
+            for ex_name in items:
+                self._tree_ids[ex_name] = self.ex_tree.insert(fnode, 'end', text=ex_name)
+        # Root exercises
+        for ex_name in self.exercises_structure.get('root', []):
+            self._tree_ids[ex_name] = self.ex_tree.insert(self._tree_root, 'end', text=ex_name)
+
+    def _tree_place(self, name):
+        """Insert or move the exercise's tree row to its sorted position under its current folder/root"""
+        folder = self._ex_location[name]
+        parent = self._tree_root if folder is None else self._folder_ids[folder]
+        iid = self._tree_ids.get(name)
+        if iid is not None and self.ex_tree.parent(iid) == parent:
+            return
+        index = bisect.bisect_left(self._exercise_list(folder), name)
+        if folder is None:
+            # Folders are listed before root exercises
+            index += len(self._folder_ids)
+        if iid is None:
+            self._tree_ids[name] = self.ex_tree.insert(parent, index, text=name)
+        else:
+            self.ex_tree.move(iid, parent, index)
+
+    def _tree_remove(self, name):
+        """Delete the exercise's tree row"""
+        iid = self._tree_ids.pop(name, None)
+        if iid is not None:
+            self.ex_tree.delete(iid)
+
     def delete_exercise(self, exercise):
         """Delete exercise"""
         if messagebox.askyesno("Confirmation", f"Delete exercise '{exercise}'?"):
-            if exercise in self.exercises_structure.get('root', []):
-                self.exercises_structure['root'].remove(exercise)
-            for items in self.exercises_structure.get('folders', {}).values():
-                if exercise in items:
-                    items.remove(exercise)
+            self._detach_exercise(exercise)
             self.exercises_structure.get('info', {}).pop(exercise, None)
             self.save_exercise_structure()
-            self.exercises = self.flatten_exercises()
-            self.manage_exercises()
+            self._remove_exercise_name(exercise)
+            self._tree_remove(exercise)
 
     # Folder and INFO operations
     def create_folder(self):
@@ -890,7 +1196,10 @@ class ModernGuitarTrainerV2:
         if folder_name not in folders:
             folders[folder_name] = []
             self.save_exercise_structure()
-            self.manage_exercises()
+            self.new_folder_entry.delete(0, 'end')
+            # Folders are listed by name, before root exercises
+            index = sorted(folders).index(folder_name)
+            self._folder_ids[folder_name] = self.ex_tree.insert(self._tree_root, index, text=f"📁 {folder_name}", open=False)
 
     def get_selected_tree_item(self):
         sel = self.ex_tree.selection()
@@ -905,6 +1214,9 @@ class ModernGuitarTrainerV2:
         if not selected:
             return
         item_id, text = selected
+        if text not in self._tree_ids:
+            # Folder or root node selected
+            return
         # If exercise selected, ask for folder
         folder_choices = sorted(self.exercises_structure.get('folders', {}).keys())
         if not folder_choices:
@@ -918,19 +1230,20 @@ class ModernGuitarTrainerV2:
         for name in folder_choices:
             tk.Radiobutton(top, text=name, variable=var, value=name, bg='#2c3e50', fg='#ecf0f1', selectcolor='#34495e').pack(anchor='w', padx=10, pady=2)
         def confirm():
-            folder = var.get()
-            if text in self.exercises_structure.get('root', []):
-                self.exercises_structure['root'].remove(text)
-            for items in self.exercises_structure.get('folders', {}).values():
-                if text in items:
-                    items.remove(text)
-            folder_list = self.exercises_structure.setdefault('folders', {}).setdefault(folder, [])
-            if text not in folder_list:
-                folder_list.append(text)
+            # The dialog is not modal: the exercise or folder may have been deleted meanwhile
+            if text not in self._ex_location:
+                messagebox.showwarning('Warning', f"Exercise '{text}' no longer exists!", parent=top)
+                top.destroy()
+                return
+            if var.get() not in self.exercises_structure.get('folders', {}):
+                messagebox.showwarning('Warning', f"Folder '{var.get()}' no longer exists!", parent=top)
+                top.destroy()
+                return
+            self._detach_exercise(text)
+            self._place_exercise(text, var.get())
             self.save_exercise_structure()
-            self.exercises = self.flatten_exercises()
             top.destroy()
-            self.manage_exercises()
+            self._tree_place(text)
         tk.Button(top, text='OK', command=confirm, bg='#27ae60', fg='white').pack(pady=8)
 
 
@@ -939,12 +1252,12 @@ class ModernGuitarTrainerV2:
         if not selected:
             return
         _, text = selected
-        for items in self.exercises_structure.get('folders', {}).values():
-            if text in items:
-                items.remove(text)
+        if self._ex_location.get(text) is not None:
+            self._detach_exercise(text)
         self.save_exercise_structure()
-        self.exercises = self.flatten_exercises()
-        self.manage_exercises()
+        if text not in self._ex_location:
+            self._remove_exercise_name(text)
+            self._tree_remove(text)
 
     def show_stats_for_selected(self):
         selected = self.get_selected_tree_item()
@@ -979,26 +1292,29 @@ class ModernGuitarTrainerV2:
             if not new_name or new_name == old_name:
                 dlg.destroy()
                 return
-            # Update in root
-            root_list = self.exercises_structure.get('root', [])
-            for i, n in enumerate(root_list):
-                if n == old_name:
-                    root_list[i] = new_name
-                    break
-            # Update in folders
-            for f, items in self.exercises_structure.get('folders', {}).items():
-                for i, n in enumerate(items):
-                    if n == old_name:
-                        items[i] = new_name
-                        break
+            # The dialog is not modal: the exercise may have been deleted meanwhile
+            if old_name not in self._ex_location:
+                messagebox.showwarning('Warning', f"Exercise '{old_name}' no longer exists!", parent=dlg)
+                dlg.destroy()
+                return
+            if self._has_exercise(new_name):
+                messagebox.showwarning('Warning', 'Such exercise already exists!', parent=dlg)
+                return
+            # Update in the folder/root list holding it
+            folder = self._ex_location[old_name]
+            self._detach_exercise(old_name)
+            self._place_exercise(new_name, folder)
             # Update INFO
             info = self.exercises_structure.get('info', {})
             if old_name in info:
                 info[new_name] = info.pop(old_name)
             self.save_exercise_structure()
-            self.exercises = self.flatten_exercises()
+            self._remove_exercise_name(old_name)
+            self._add_exercise_name(new_name)
             dlg.destroy()
-            self.manage_exercises()
+            self._tree_remove(old_name)
+            self._tree_place(new_name)
+            self.ex_tree.selection_set(self._tree_ids[new_name])
         btns = tk.Frame(dlg, bg='#2c3e50')
         btns.pack(pady=8)
         tk.Button(btns, text='Save', bg='#27ae60', fg='white', relief='flat', padx=12, command=do_rename).pack(side='left', padx=6)
@@ -1046,21 +1362,18 @@ class ModernGuitarTrainerV2:
             if not name:
                 messagebox.showwarning('Warning', 'Enter exercise name!')
                 return
-            if name in self.flatten_exercises():
+            if self._has_exercise(name):
                 messagebox.showwarning('Warning', 'Such exercise already exists!')
                 return
             folder = folder_var.get()
-            if folder == 'Root':
-                self.exercises_structure.setdefault('root', []).append(name)
-            else:
-                self.exercises_structure.setdefault('folders', {}).setdefault(folder, []).append(name)
+            self._place_exercise(name, None if folder == 'Root' else folder)
             self.exercises_structure.setdefault('info', {})[name] = {
                 'link': link_var.get().strip(), 'note': note_var.get().strip()
             }
             self.save_exercise_structure()
-            self.exercises = self.flatten_exercises()
+            self._add_exercise_name(name)
             dlg.destroy()
-            self.manage_exercises()
+            self._tree_place(name)
         tk.Button(btns, text='Add', bg='#27ae60', fg='white', relief='flat', padx=12, command=add_now).pack(side='right', padx=6)
         tk.Button(btns, text='Cancel', bg='#95a5a6', fg='white', relief='flat', padx=12, command=dlg.destroy).pack(side='right')
 
@@ -1077,12 +1390,26 @@ class ModernGuitarTrainerV2:
         for name in folders:
             tk.Radiobutton(dlg, text=name, variable=var, value=name, bg='#2c3e50', fg='#ecf0f1', selectcolor='#34495e').pack(anchor='w', padx=16)
         def do_delete():
-            items = self.exercises_structure.get('folders', {}).pop(var.get(), [])
+            folder = var.get()
+            items = self.exercises_structure.get('folders', {}).pop(folder, [])
             root_list = self.exercises_structure.setdefault('root', [])
-            root_list.extend(ex for ex in items if ex not in root_list)
+            # Deleting the folder row drops its exercise rows too; they are re-inserted under root below
+            fid = self._folder_ids.pop(folder, None)
+            if fid is not None:
+                self.ex_tree.delete(fid)
+            for ex in items:
+                # A name may already be listed in root as well; don't add a second copy
+                i = bisect.bisect_left(root_list, ex)
+                if i == len(root_list) or root_list[i] != ex:
+                    root_list.insert(i, ex)
+                self._ex_location[ex] = None
+                # Rows that lived under the deleted folder are gone; root rows are kept
+                iid = self._tree_ids.get(ex)
+                if iid is None or not self.ex_tree.exists(iid):
+                    self._tree_ids.pop(ex, None)
+                    self._tree_place(ex)
             self.save_exercise_structure()
             dlg.destroy()
-            self.manage_exercises()
         btns = tk.Frame(dlg, bg='#2c3e50')
         btns.pack(pady=12)
         tk.Button(btns, text='Delete', bg='#e74c3c', fg='white', relief='flat', padx=12, command=do_delete).pack(side='left', padx=6)
@@ -1094,73 +1421,68 @@ class ModernGuitarTrainerV2:
             return
         _, text = selected
         info_map = self.exercises_structure.setdefault('info', {})
-        info_map[text] = {
+        info = {
             'link': self.info_link_var.get().strip(),
             'note': self.info_note_var.get().strip()
         }
+        if info_map.get(text) == info:
+            return
+        info_map[text] = info
         self.save_exercise_structure()
 
+    def _rebuild_stats_cache(self):
+        """Aggregate workout data per exercise in a single pass"""
+        self._stats_by_exercise = {}
+        self._total_seconds = 0
+        for data in self.workout_data:
+            self._add_to_stats_cache(data)
+
+    def _add_to_stats_cache(self, data):
+        """Fold one workout record into the per-exercise stats cache"""
+        st = self._stats_by_exercise.setdefault(data.exercise, {
+            'sessions': 0, 'total_time': 0, 'bpm_sum': 0, 'bpm_count': 0, 'best_bpm': 0, 'last_ts': None,
+            'bpm_points': []  # (datetime, bpm) of sessions with a numeric BPM, for the progress chart
+        })
+        seconds = data.seconds
+        st['sessions'] += 1
+        st['total_time'] += seconds
+        self._total_seconds += seconds
+        bpm = data.bpm
+        if bpm.isdigit():
+            st['bpm_sum'] += int(bpm)
+            st['bpm_count'] += 1
+            st['best_bpm'] = max(st['best_bpm'], int(bpm))
+            st['bpm_points'].append((data.ts, int(bpm)))
+        ts = data.ts
+        if st['last_ts'] is None or ts > st['last_ts']:
+            st['last_ts'] = ts
+
     def get_exercise_stats(self, exercise_name):
         """Get statistics for exercise"""
-        # Filter data by exercise (exact match)
-        exercise_data = [data for data in self.workout_data if data.get('exercise') == exercise_name]
-        
-        if not exercise_data:
+        st = self._stats_by_exercise.get(exercise_name)
+        if not st:
             return {
                 'total_sessions': 0,
                 'total_time_seconds': 0,
                 'total_time_formatted': '00:00',
                 'avg_bpm': 0
             }
-        
-        # Calculate total time in seconds
-        total_seconds = 0
-        total_bpm = 0
-        valid_bpm_count = 0
-        
-        for data in exercise_data:
-            total_seconds += self._parse_time(data.get('time', '00:00'))
-            
-            # Calculate average BPM
-            try:
-                if data['bpm'].isdigit():
-                    total_bpm += int(data['bpm'])
-                    valid_bpm_count += 1
-            except (ValueError, KeyError):
-                continue
-        
-        total_time_formatted = self._format_time(total_seconds)
-        
-        # Calculate average BPM
-        avg_bpm = total_bpm // valid_bpm_count if valid_bpm_count > 0 else 0
-        
         return {
-            'total_sessions': len(exercise_data),
-            'total_time_seconds': total_seconds,
-            'total_time_formatted': total_time_formatted,
-            'avg_bpm': avg_bpm
+            'total_sessions': st['sessions'],
+            'total_time_seconds': st['total_time'],
+            'total_time_formatted': self._format_time(st['total_time']),
+            'avg_bpm': st['bpm_sum'] // st['bpm_count'] if st['bpm_count'] > 0 else 0
         }
 
     def get_best_bpm(self, exercise_name):
         """Find best BPM for exercise"""
-        best = 0
-        for data in self.workout_data:
-            if data.get('exercise') == exercise_name and str(data.get('bpm', '')).isdigit():
-                best = max(best, int(data['bpm']))
-        return best
+        st = self._stats_by_exercise.get(exercise_name)
+        return st['best_bpm'] if st else 0
 
     def _get_last_played_timestamp(self, exercise_name):
         """Get last played timestamp for exercise"""
-        last_ts = None
-        for data in self.workout_data:
-            if data.get('exercise') == exercise_name:
-                try:
-                    ts = datetime.fromisoformat(data['timestamp'])
-                    if last_ts is None or ts > last_ts:
-                        last_ts = ts
-                except Exception:
-                    continue
-        return last_ts
+        st = self._stats_by_exercise.get(exercise_name)
+        return st['last_ts'] if st else None
 
     def get_last_played_date(self, exercise_name):
         """Get last played date for exercise in DD Month YYYY format"""
@@ -1174,21 +1496,28 @@ class ModernGuitarTrainerV2:
             return self.stale_days > 0
         return (datetime.now() - last_ts).days >= self.stale_days
 
-    def decorate_stale_label(self, exercise_name):
-        if self.is_stale_exercise(exercise_name):
-            return f"{exercise_name}    🔴"
-        return exercise_name
+    def _refresh_stale_set(self):
+        """Precompute the set of stale exercises once instead of checking per label"""
+        self._stale_set = {name for name in self.exercises if self.is_stale_exercise(name)}
+
+    def stale_tags(self, exercise_name):
+        """Treeview tags for an exercise row; stale rows are drawn red by the 'stale' tag"""
+        return ('stale',) if exercise_name in self._stale_set else ()
 
     def open_settings(self):
         win = tk.Toplevel(self.master)
         win.title('Settings')
         win.configure(bg='#2c3e50')
-        win.geometry('360x250')
+        win.geometry('360x290')
         tk.Label(win, text='After how many days consider exercise as "not played recently"', bg='#2c3e50', fg='#ecf0f1', wraplength=320).pack(pady=12)
         val = tk.IntVar(value=int(self.stale_days))
         tk.Spinbox(win, from_=1, to=60, textvariable=val, width=5).pack()
+        fast_plot = tk.BooleanVar(value=self.use_fast_plot)
+        tk.Checkbutton(win, text='Fast charts (without matplotlib)', variable=fast_plot, bg='#2c3e50', fg='#ecf0f1',
+                       selectcolor='#34495e', activebackground='#2c3e50').pack(pady=(8, 0))
         def save_and_close():
             self.stale_days = int(val.get())
+            self.use_fast_plot = fast_plot.get()
             self.save_settings()
             win.destroy()
         tk.Button(win, text='Save', bg='#27ae60', fg='white', relief='flat', padx=12, command=save_and_close).pack(pady=12)
@@ -1197,9 +1526,9 @@ class ModernGuitarTrainerV2:
         # GitHub link
         github_frame = tk.Frame(win, bg='#2c3e50')
         github_frame.pack(pady=15)
-        tk.Label(github_frame, text='Project on GitHub:', bg='#2c3e50', fg='#ecf0f1', font=('Helvetica', 9)).pack()
+        tk.Label(github_frame, text='Project on GitHub:', bg='#2c3e50', fg='#ecf0f1', font=self.fonts['tiny']).pack()
         github_link = tk.Label(github_frame, text='https://github.com/Leesty/Guitar-Trainer-/tree/main', 
-                              bg='#2c3e50', fg='#3498db', cursor='hand2', font=('Helvetica', 9, 'underline'))
+                              bg='#2c3e50', fg='#3498db', cursor='hand2', font=self.fonts['link'])
         github_link.pack(pady=5)
         github_link.bind('<Button-1>', lambda e: webbrowser.open('https://github.com/Leesty/Guitar-Trainer-/tree/main'))
 
@@ -1212,7 +1541,7 @@ class ModernGuitarTrainerV2:
         win.title(f"INFO: {ex}")
         win.configure(bg='#2c3e50')
         win.geometry('600x400')
-        tk.Label(win, text=ex, font=('Helvetica', 14, 'bold'), bg='#2c3e50', fg='#ecf0f1').pack(pady=8)
+        tk.Label(win, text=ex, font=self.fonts['h4'], bg='#2c3e50', fg='#ecf0f1').pack(pady=8)
         for label, value in [('Link', link), ('Note', note)]:
             frame = tk.Frame(win, bg='#2c3e50')
             frame.pack(fill='x', padx=12, pady=6)
@@ -1227,8 +1556,7 @@ class ModernGuitarTrainerV2:
 
     def get_total_training_time(self):
         """Get total time of all workouts"""
-        total_seconds = sum(self._parse_time(data.get('time', '00:00')) for data in self.workout_data)
-        return f"⏱️ Total Time: {self._format_time(total_seconds)}"
+        return f"⏱️ Total Time: {self._format_time(self._total_seconds)}"
 
     def update_total_time_display(self):
         """Update total time display"""
@@ -1245,7 +1573,12 @@ class ModernGuitarTrainerV2:
 
     def set_volume(self, volume):
         """Set metronome volume (0.0 - 1.0)"""
-        self.metronome_volume = max(0.0, min(1.0, volume))
+        volume = max(0.0, min(1.0, volume))
+        if volume == self.metronome_volume:
+            return
+        self.metronome_volume = volume
+        if self._click_sound is not None:
+            self._click_sound.set_volume(volume)
 
     def change_volume(self, delta):
         """Change metronome volume by delta"""
@@ -1254,150 +1587,186 @@ class ModernGuitarTrainerV2:
     def toggle_metronome(self):
         """Toggle metronome on/off"""
         if not self.metronome_running:
-            self.metronome_running = True
-            try:
-                if hasattr(self, 'metronome_start_btn'):
-                    self.metronome_start_btn.winfo_exists()
-                    self.metronome_start_btn.config(text="⏸️ Stop", bg='#e74c3c')
-            except (tk.TclError, AttributeError):
-                pass
-            self.metronome_thread = threading.Thread(target=self.metronome_loop, daemon=True)
-            self.metronome_thread.start()
+            self._play_metronome()
         else:
-            self.metronome_running = False
+            self._stop_metronome()
+
+    def _ensure_audio(self):
+        """Import pygame, init the mixer and load the click on first use"""
+        if self._click_sound is None:
+            import pygame
+            pygame.mixer.init()
+            self._click_sound = self._load_click_sound()
+
+    def _load_click_sound(self):
+        """Load click from untitled.wav, or synthesize a short 1 kHz blip if unavailable"""
+        import pygame
+        metronome_file = os.path.join(self.script_dir, 'untitled.wav')
+        sound = None
+        if os.path.exists(metronome_file):
             try:
-                if hasattr(self, 'metronome_start_btn'):
-                    self.metronome_start_btn.winfo_exists()
-                    self.metronome_start_btn.config(text="▶️ Start", bg='#27ae60')
-            except (tk.TclError, AttributeError):
-                pass
-
-    def metronome_loop(self):
-        """Metronome loop"""
+                sound = pygame.mixer.Sound(metronome_file)
+            except Exception:
+                sound = None
+        if sound is None:
+            import numpy as np
+            freq, _, channels = pygame.mixer.get_init()
+            t = np.arange(int(freq * 0.01)) / freq
+            samples = (np.sin(2 * np.pi * 1000 * t) * 0.8 * 32767).astype(np.int16)
+            if channels > 1:
+                samples = np.ascontiguousarray(np.repeat(samples[:, None], channels, axis=1))
+            sound = pygame.sndarray.make_sound(samples)
+        sound.set_volume(self.metronome_volume)
+        return sound
+
+    def _play_metronome(self):
+        """Start the click chain on the Tk main loop; the metronome is only marked running once audio is ready"""
         try:
-            # Load metronome sound
-            metronome_file = os.path.join(self.script_dir, 'untitled.wav')
-            if os.path.exists(metronome_file):
-                metronome_sound = pygame.mixer.Sound(metronome_file)
-            else:
-                # Fallback to winsound if file not found
-                metronome_sound = None
-        except:
-            metronome_sound = None
-            
-        while self.metronome_running:
-            try:
-                if metronome_sound:
-                    metronome_sound.set_volume(self.metronome_volume)
-                    metronome_sound.play()
-                else:
-                    # Fallback to winsound
-                    duration_ms = int(50)
-                    try:
-                        winsound.Beep(400, duration_ms)
-                    except RuntimeError:
-                        pass
-                time.sleep(60.0 / self.metronome_bpm)
-            except:
-                break
+            self._ensure_audio()
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not start the metronome sound: {e}")
+            return
+        self.metronome_running = True
+        self._set_metronome_button(True)
+        if self._metronome_after_id is not None:
+            self.master.after_cancel(self._metronome_after_id)
+        self._metronome_next_beat = time.monotonic()
+        self._metronome_tick()
+
+    def _metronome_tick(self):
+        """Play one click and schedule the next one against the monotonic clock so delays don't accumulate"""
+        self._metronome_after_id = None
+        if not self.metronome_running:
+            return
+        self._click_sound.play()
+        self._metronome_next_beat += 60.0 / self.metronome_bpm
+        now = time.monotonic()
+        if self._metronome_next_beat < now:
+            # The main loop stalled past a beat: skip the missed beats instead of replaying them back to back
+            self._metronome_next_beat = now + 60.0 / self.metronome_bpm
+        delay = max(1, int((self._metronome_next_beat - now) * 1000))
+        self._metronome_after_id = self.master.after(delay, self._metronome_tick)
 
     def view_history(self):
         """View workout history"""
         self.button_frame.pack_forget()
         self.history_frame.pack(fill='both', expand=True, padx=20, pady=20)
         
-        # Clear frame
-        for widget in self.history_frame.winfo_children():
-            widget.destroy()
-        
+        # The screen is built once; later visits only update the day rows
+        if self._history_tree is None:
+            self._build_history_screen()
+        self._render_history()
+
+    def _build_history_screen(self):
+        """Create the persistent history widgets: title, day tree, empty note and back button"""
         # Title
         tk.Label(self.history_frame, 
                 text="📊 Workout History", 
-                font=('Helvetica', 18, 'bold'),
+                font=self.fonts['h2'],
                 bg='#34495e', fg='#ecf0f1').pack(pady=20)
         
-        if not self.workout_data:
-            tk.Label(self.history_frame, 
-                    text="Workout history is empty", 
-                    font=('Helvetica', 14),
-                    bg='#34495e', fg='#bdc3c7').pack(pady=50)
-        else:
-            days_data = self._group_data_by_days()
-            
-            # Create scrollable frame for days
-            canvas = tk.Canvas(self.history_frame, bg='#34495e', highlightthickness=0, height=400)
-            scrollbar = ttk.Scrollbar(self.history_frame, orient="vertical", command=canvas.yview)
-            scrollable_frame = tk.Frame(canvas, bg='#34495e')
-            
-            scrollable_frame.bind(
-                "<Configure>",
-                lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-            )
-            
-            canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-            canvas.configure(yscrollcommand=scrollbar.set)
-            
-            # Display days
-            for date in self._sort_dates(days_data.keys()):
-                day_frame = tk.Frame(scrollable_frame, bg='#34495e', relief='raised', bd=1)
-                day_frame.pack(fill='x', pady=5, padx=10)
-                
-                # Day header with delete button
-                day_header_frame = tk.Frame(day_frame, bg='#34495e')
-                day_header_frame.pack(fill='x', padx=10, pady=5)
-                
-                total_day_seconds = sum(self._parse_time(data.get('time', '00:00')) for data in days_data[date])
-                total_day_time = self._format_time(total_day_seconds)
-                
-                tk.Label(day_header_frame, 
-                        text=f"📅 {date} | ⏱️ Total Time: {total_day_time}", 
-                        font=('Helvetica', 12, 'bold'),
-                        bg='#34495e', fg='#3498db').pack(side='left')
-                
-                # Delete day button
-                tk.Button(day_header_frame, 
-                         text="🗑️ Delete Day", 
-                         font=('Helvetica', 8),
-                         bg='#e74c3c', fg='white',
-                         relief='flat', padx=8, pady=2,
-                         command=lambda d=date: self.delete_day(d)).pack(side='right')
-                
-                # Exercises for day
-                for data in days_data[date]:
-                    exercise_frame = tk.Frame(day_frame, bg='#34495e')
-                    exercise_frame.pack(fill='x', padx=20, pady=2)
-                    
-                    tk.Label(exercise_frame, 
-                            text=f"🎸 {data['exercise']} - {data['time']} - {data['bpm']} BPM", 
-                            font=('Helvetica', 10),
-                            bg='#34495e', fg='#ecf0f1').pack(side='left')
-            
-            canvas.pack(side="left", fill="both", expand=True)
-            scrollbar.pack(side="right", fill="y")
+        self._history_empty_label = tk.Label(self.history_frame, 
+                text="Workout history is empty", 
+                font=self.fonts['subtitle'],
+                bg='#34495e', fg='#bdc3c7')
+        
+        # One node per day (iid = ISO day); exercise rows are inserted only when a day is opened.
+        # Tree and scrollbar share their own frame so the buttons below keep the full width
+        self._history_body = tk.Frame(self.history_frame, bg='#34495e')
+        tree = self._history_tree = ttk.Treeview(self._history_body, columns=('time', 'bpm'), show='tree headings', height=16)
+        tree.heading('#0', text='Day / Exercise', anchor='w')
+        tree.heading('time', text='Time')
+        tree.heading('bpm', text='BPM')
+        tree.column('#0', width=420)
+        tree.column('time', width=140, anchor='center')
+        tree.column('bpm', width=100, anchor='center')
+        scrollbar = ttk.Scrollbar(self._history_body, orient="vertical", command=tree.yview)
+        tree.configure(yscrollcommand=scrollbar.set)
+        tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+        tree.bind('<<TreeviewOpen>>', self._expand_history_day)
+        
+        # Delete day from the context menu or with the button below
+        self._history_menu = tk.Menu(tree, tearoff=0)
+        self._history_menu.add_command(label="🗑️ Delete Day", command=lambda: self._delete_history_day(self._history_tree.focus()))
+        def on_right_click(event):
+            row = tree.identify_row(event.y)
+            if row:
+                tree.selection_set(row)
+                tree.focus(row)
+                self._history_menu.tk_popup(event.x_root, event.y_root)
+        tree.bind('<Button-3>', on_right_click)
         
         # Back button
-        back_frame = tk.Frame(self.history_frame, bg='#34495e')
-        back_frame.pack(pady=20)
+        self._history_back_frame = tk.Frame(self.history_frame, bg='#34495e')
+        self._history_back_frame.pack(pady=20)
         
-        tk.Button(back_frame, 
+        tk.Button(self._history_back_frame, 
+                 text="🗑️ Delete Day", 
+                 font=self.fonts['button'],
+                 bg='#e74c3c', fg='white',
+                 relief='flat', padx=20, pady=10,
+                 command=lambda: self._delete_history_day(self._history_tree.focus())).pack(side='left', padx=6)
+        tk.Button(self._history_back_frame, 
                  text="🔙 Back", 
-                 font=('Helvetica', 12, 'bold'),
+                 font=self.fonts['button'],
                  bg='#95a5a6', fg='white',
                  relief='flat', padx=20, pady=10,
-                 command=self.show_main_screen).pack()
+                 command=self.show_main_screen).pack(side='left', padx=6)
 
-    def delete_day(self, date):
-        """Delete entire day of workouts"""
-        day_workouts = [d for d in self.workout_data 
-                       if datetime.fromisoformat(d['timestamp']).strftime('%d %B %Y') == date]
+    def _render_history(self):
+        """Refill the history tree with one collapsed node per day"""
+        back = self._history_back_frame
+        tree = self._history_tree
+        if not self.workout_data:
+            self._history_body.pack_forget()
+            self._history_empty_label.pack(pady=50, before=back)
+            return
+        self._history_empty_label.pack_forget()
+        self._history_body.pack(fill="both", expand=True, before=back)
+        
+        days_data, day_seconds, days = self._aggregate_days()
+        tree.delete(*tree.get_children())
+        self._history_loaded = set()
+        for day in days:
+            tree.insert('', 'end', iid=day, text=f"📅 {self._format_day(day)}",
+                        values=(f"⏱️ {self._format_time(day_seconds[day])}", ''))
+            # Placeholder so the day shows an expander; replaced by real rows in _expand_history_day
+            tree.insert(day, 'end')
+        tree.yview_moveto(0)
+
+    def _expand_history_day(self, event):
+        """Insert the exercise rows of the day being opened, once per render"""
+        tree = self._history_tree
+        day = tree.focus()
+        if not day or tree.parent(day) or day in self._history_loaded:
+            return
+        tree.delete(*tree.get_children(day))
+        for data in self._group_data_by_days().get(day, ()):
+            tree.insert(day, 'end', text=f"🎸 {data.exercise}", values=(data.time, data.bpm))
+        self._history_loaded.add(day)
+
+    def _delete_history_day(self, item):
+        """Delete the day of a history tree item (a day node or one of its exercise rows)"""
+        if not item:
+            messagebox.showinfo("Information", "Select a day first!")
+            return
+        self.delete_day(self._history_tree.parent(item) or item)
+
+    def delete_day(self, day):
+        """Delete entire day of workouts (day is an ISO date string)"""
+        date = self._format_day(day)
+        day_workouts = list(self._group_data_by_days().get(day, ()))
         if not day_workouts:
             messagebox.showinfo("Information", "No workouts found for this day!")
             return
-        workout_list = "\n".join([f"• {w['exercise']} - {w['time']} - {w['bpm']} BPM" for w in day_workouts])
+        workout_list = "\n".join([f"• {w.exercise} - {w.time} - {w.bpm} BPM" for w in day_workouts])
         if messagebox.askyesno("Delete Confirmation", 
                               f"Delete entire day {date}?\n\n{workout_list}\n\nTotal: {len(day_workouts)} workouts"):
-            for workout in day_workouts:
-                self.workout_data.remove(workout)
+            # One pass over the list instead of a list.remove() scan per workout
+            self.workout_data = [d for d in self.workout_data if d.day != day]
+            self._data_version += 1
+            self._rebuild_stats_cache()
             self.save_data()
             self.update_total_time_display()
             self.view_history()
@@ -1408,10 +1777,10 @@ class ModernGuitarTrainerV2:
 
     def show_exercise_stats(self, exercise_name):
         """Show exercise statistics"""
-        # Filter data by exercise
-        exercise_data = [data for data in self.workout_data if data['exercise'] == exercise_name]
+        # Sessions and chart points come from the stats cache, no scan of the workout list
+        cached = self._stats_by_exercise.get(exercise_name)
         
-        if len(exercise_data) < 1:
+        if not cached:
             messagebox.showinfo("Information", f"No data for exercise '{exercise_name}'")
             return
         
@@ -1428,7 +1797,7 @@ class ModernGuitarTrainerV2:
         # Title
         tk.Label(stats_window, 
                 text=f"📊 Exercise Statistics: {exercise_name}", 
-                font=('Helvetica', 16, 'bold'),
+                font=self.fonts['h3'],
                 bg='#2c3e50', fg='#ecf0f1').pack(pady=20)
         
         # General Statistics
@@ -1437,7 +1806,7 @@ class ModernGuitarTrainerV2:
         
         tk.Label(stats_frame, 
                 text="📈 General Statistics", 
-                font=('Helvetica', 14, 'bold'),
+                font=self.fonts['h4'],
                 bg='#34495e', fg='#3498db').pack(pady=10)
         
         # Statistics details
@@ -1446,108 +1815,191 @@ class ModernGuitarTrainerV2:
         
         tk.Label(details_frame, 
                 text=f"🎯 Total Sessions: {stats['total_sessions']}", 
-                font=('Helvetica', 12),
+                font=self.fonts['body'],
                 bg='#34495e', fg='#ecf0f1').pack(anchor='w', pady=2)
         
         tk.Label(details_frame, 
                 text=f"⏱️ Total Time: {stats['total_time_formatted']}", 
-                font=('Helvetica', 12),
+                font=self.fonts['body'],
                 bg='#34495e', fg='#ecf0f1').pack(anchor='w', pady=2)
         
         tk.Label(details_frame, 
                 text=f"📊 Best BPM: {best_bpm}", 
-                font=('Helvetica', 12),
+                font=self.fonts['body'],
                 bg='#34495e', fg='#ecf0f1').pack(anchor='w', pady=2)
         
-        if len(exercise_data) >= 2:
-            dates, bpms = [], []
-            for data in sorted(exercise_data, key=lambda x: x['timestamp']):
-                try:
-                    if data['bpm'].isdigit():
-                        dates.append(datetime.fromisoformat(data['timestamp']))
-                        bpms.append(int(data['bpm']))
-                except (ValueError, KeyError):
-                    continue
+        if cached['sessions'] >= 2:
+            points = sorted(cached['bpm_points'], key=lambda p: p[0])
+            dates = [ts for ts, _ in points]
+            bpms = [bpm for _, bpm in points]
             if len(dates) >= 2:
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.plot(dates, bpms, 'o-', linewidth=2, markersize=8, color='#3498db')
-                ax.set_title(f'Exercise Progress: {exercise_name}', fontsize=16, fontweight='bold')
-                ax.set_xlabel('Date', fontsize=12)
-                ax.set_ylabel('BPM', fontsize=12)
-                ax.grid(True, alpha=0.3)
-                ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m'))
-                ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
-                plt.xticks(rotation=45)
-                for date, bpm in zip(dates, bpms):
-                    ax.annotate(f'{bpm}', (date, bpm), textcoords="offset points", xytext=(0,10), ha='center', fontsize=8)
-                plt.tight_layout()
-                canvas = FigureCanvasTkAgg(fig, stats_window)
-                canvas.draw()
-                canvas.get_tk_widget().pack(fill='both', expand=True, padx=20, pady=20)
+                if self.use_fast_plot:
+                    self._show_tk_plot(stats_window, dates, bpms)
+                else:
+                    self._show_mpl_plot(stats_window, exercise_name, dates, bpms)
             else:
                 tk.Label(stats_window, text="📊 Not enough data to build chart", 
-                        font=('Helvetica', 12), bg='#2c3e50', fg='#95a5a6').pack(pady=20)
+                        font=self.fonts['body'], bg='#2c3e50', fg='#95a5a6').pack(pady=20)
         else:
             tk.Label(stats_window, text="📊 Not enough data to build chart", 
-                    font=('Helvetica', 12), bg='#2c3e50', fg='#95a5a6').pack(pady=20)
-        tk.Button(stats_window, text="🔙 Close", font=('Helvetica', 12, 'bold'), bg='#95a5a6', fg='white',
+                    font=self.fonts['body'], bg='#2c3e50', fg='#95a5a6').pack(pady=20)
+        tk.Button(stats_window, text="🔙 Close", font=self.fonts['button'], bg='#95a5a6', fg='white',
                  relief='flat', padx=20, pady=10, command=stats_window.destroy).pack(pady=20)
 
+    def _show_mpl_plot(self, stats_window, exercise_name, dates, bpms):
+        """Embed BPM progress chart drawn with matplotlib"""
+        # Plotting stack is only loaded when a chart is actually opened
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        import matplotlib.dates as mdates
+        shared = not self._stats_fig_busy
+        if shared:
+            if self._stats_fig is None:
+                self._stats_fig = Figure(figsize=(10, 6))
+                self._stats_ax = self._stats_fig.add_subplot(111)
+            fig, ax = self._stats_fig, self._stats_ax
+            ax.cla()
+            self._stats_fig_busy = True
+        else:
+            # The shared Figure is still shown in another window; give this one its own
+            fig = Figure(figsize=(10, 6))
+            ax = fig.add_subplot(111)
+        def release(event):
+            # Drop the plotted artists when the window goes (Close button or window manager)
+            if event.widget is stats_window:
+                if shared:
+                    ax.cla()
+                    self._stats_fig_busy = False
+                else:
+                    fig.clf()
+        stats_window.bind('<Destroy>', release, add='+')
+        ax.plot(dates, bpms, 'o-', linewidth=2, markersize=8, color='#3498db')
+        ax.set_title(f'Exercise Progress: {exercise_name}', fontsize=16, fontweight='bold')
+        ax.set_xlabel('Date', fontsize=12)
+        ax.set_ylabel('BPM', fontsize=12)
+        ax.grid(True, alpha=0.3)
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%d.%m'))
+        ax.xaxis.set_major_locator(mdates.DayLocator(interval=1))
+        ax.tick_params(axis='x', labelrotation=45)
+        for date, bpm in zip(dates, bpms):
+            ax.annotate(f'{bpm}', (date, bpm), textcoords="offset points", xytext=(0,10), ha='center', fontsize=8)
+        fig.tight_layout()
+        canvas = FigureCanvasTkAgg(fig, stats_window)
+        canvas.draw_idle()
+        canvas.get_tk_widget().pack(fill='both', expand=True, padx=20, pady=20)
+
+    def _show_tk_plot(self, stats_window, dates, bpms):
+        """Embed BPM progress chart drawn with tk.Canvas primitives"""
+        canvas = tk.Canvas(stats_window, bg='#ecf0f1', highlightthickness=0)
+        canvas.pack(fill='both', expand=True, padx=20, pady=20)
+        points = [(d.timestamp(), b) for d, b in zip(dates, bpms)]
+        labels = [d.strftime('%d.%m') for d in dates]
+        xlim = (points[0][0], points[-1][0])
+        ylim = (min(bpms) - 5, max(bpms) + 5)
+        def redraw(event=None):
+            canvas.delete('all')
+            self._draw_tk_plot(canvas, points, xlim, ylim, labels)
+        canvas.bind('<Configure>', redraw)
+
+    def _draw_tk_plot(self, canvas, points, xlim, ylim, labels):
+        """Draw (x, y) points as one polyline with simple axes, scaled to the canvas size"""
+        width, height = canvas.winfo_width(), canvas.winfo_height()
+        left, right, top, bottom = 50, 20, 25, 40
+        sx = (width - left - right) / ((xlim[1] - xlim[0]) or 1)
+        sy = (height - top - bottom) / ((ylim[1] - ylim[0]) or 1)
+        y_axis = height - bottom
+        coords = []
+        for x, y in points:
+            coords.append(left + (x - xlim[0]) * sx)
+            coords.append(y_axis - (y - ylim[0]) * sy)
+        # Axes and horizontal grid lines
+        canvas.create_line(left, top, left, y_axis, fill='#7f8c8d')
+        canvas.create_line(left, y_axis, width - right, y_axis, fill='#7f8c8d')
+        for i in range(5):
+            value = ylim[0] + (ylim[1] - ylim[0]) * i / 4
+            y = y_axis - (value - ylim[0]) * sy
+            canvas.create_line(left, y, width - right, y, fill='#d5dbdb')
+            canvas.create_text(left - 6, y, text=f"{value:.0f}", anchor='e', font=self.fonts['micro'])
+        canvas.create_text(12, top - 12, text='BPM', anchor='w', font=self.fonts['tiny_bold'])
+        # Whole series in a single create_line call
+        canvas.create_line(*coords, fill='#3498db', width=2)
+        label_step = max(1, len(points) // 10)
+        for i in range(0, len(coords), 2):
+            x, y = coords[i], coords[i + 1]
+            n = i // 2
+            canvas.create_oval(x - 4, y - 4, x + 4, y + 4, fill='#3498db', outline='')
+            canvas.create_text(x, y - 10, text=str(points[n][1]), font=self.fonts['micro'])
+            if n % label_step == 0:
+                canvas.create_text(x, y_axis + 12, text=labels[n], font=self.fonts['micro'])
+
     def load_data(self):
         """Load data"""
         if os.path.exists(self.data_file):
             try:
                 with open(self.data_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Parse data from markdown file
+                    # Parse data from markdown file, streaming it line by line
                     self.workout_data = []
-                    lines = content.split('\n')
                     current_date = None
+                    current_ts = None  # parsed once per day header and shared by its rows
                     
-                    for line in lines:
-                        if line.startswith('## '):
-                            current_date = line[3:].strip()
-                        elif line.startswith('| ') and current_date and not line.startswith('| ---') and 'BPM' not in line:
-                            parts = line.split('|')
-                            if len(parts) >= 4:
-                                exercise = parts[1].strip()
-                                if exercise and not exercise.startswith('-') and exercise != 'Exercise Name':
-                                    try:
-                                        timestamp = datetime.strptime(current_date, '%d %B %Y').isoformat()
-                                    except:
-                                        timestamp = datetime.now().isoformat()
-                                    self.workout_data.append({
-                                        'exercise': exercise, 'time': parts[2].strip(), 'bpm': parts[3].strip(),
-                                        'timestamp': timestamp
-                                    })
+                    for line in f:
+                        day = _DAY_RE.match(line)
+                        if day:
+                            current_date = day.group(1).strip()
+                            try:
+                                current_ts = _parse_day_header(current_date)
+                                current_iso = current_ts.isoformat()
+                                current_day = current_iso[:10]
+                            except ValueError:
+                                current_ts = None
+                            continue
+                        row = _ROW_RE.match(line) if current_date else None
+                        if row:
+                            exercise, time_str, bpm = (part.strip() for part in row.groups())
+                            # Skip the table header and the '| --- |' separator
+                            if exercise and not exercise.startswith('-') and bpm != 'BPM':
+                                if current_ts is not None:
+                                    ts, ts_iso, ts_day = current_ts, current_iso, current_day
+                                else:
+                                    ts = datetime.now()
+                                    ts_iso = ts.isoformat()
+                                    ts_day = ts_iso[:10]
+                                self.workout_data.append(Workout(exercise, time_str, bpm, ts_iso, ts, self._parse_time(time_str), ts_day))
             except Exception:
                 self.workout_data = []
+        self._data_version += 1
+        self._rebuild_stats_cache()
 
     def save_data(self):
+        """Schedule saving data to markdown file"""
+        self._mark_dirty('data')
+
+    def _write_data(self, sync=False):
         """Save data to markdown file"""
         try:
-            days_data = self._group_data_by_days()
+            days_data, _, days = self._aggregate_days()
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.data_file) if os.path.dirname(self.data_file) else '.', exist_ok=True)
-            # Write directly to file (flushed immediately)
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                f.write("# Guitar Exercises\n\n")
-                
-                if not days_data:
-                    f.write("Workout history is empty.\n")
-                else:
-                    for date in self._sort_dates(days_data.keys()):
-                        f.write(f"## {date}\n\n")
-                        f.write("| Exercise Name | Time  | BPM |\n")
-                        f.write("| ------------------- | ------ | --- |\n")
-                        
-                        for data in days_data[date]:
-                            f.write(f"| {data['exercise']} | {data['time']} | {data['bpm']} |\n")
-                        
-                        f.write("\n")
-                # Force flush to disk
-                f.flush()
-                os.fsync(f.fileno())
+            # Write to a temp file first and swap it in once it's complete
+            tmp_file = self.data_file + '.tmp'
+            # Build the whole file in memory and hand it to the file object in one write
+            buf = ["# Guitar Exercises\n\n"]
+            if not days_data:
+                buf.append("Workout history is empty.\n")
+            else:
+                for day in days:
+                    buf.append(f"## {self._format_day(day)}\n\n"
+                               "| Exercise Name | Time  | BPM |\n"
+                               "| ------------------- | ------ | --- |\n")
+                    buf.extend(f"| {data.exercise} | {data.time} | {data.bpm} |\n" for data in days_data[day])
+                    buf.append("\n")
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                f.write(''.join(buf))
+                # Force flush to disk only when asked (on close); the mainloop never blocks on fsync
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.data_file)
         except Exception as e:
             # Silently fail - data will still be in memory
             print(f"Error saving data: {e}")